@@ -10,31 +10,51 @@ Design language:
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Iterable, Mapping, Optional
+
 # ---------------------------------------------------------------------------
 #  Color Palette — Deep Navy + Cyan / Purple glass
 # ---------------------------------------------------------------------------
 
-COLORS = {
+# Base colors that translucent palette entries are derived from
+_ACCENT_RGB = (56, 189, 248)        # accent
+_SECONDARY_RGB = (167, 139, 250)    # secondary
+_CARD_RGB = (21, 28, 46)            # bg_card
+
+
+@functools.lru_cache(maxsize=None)
+def _rgba(rgb: tuple[int, int, int], alpha: float) -> str:
+    """Format *rgb* at *alpha* as a QSS rgba() color."""
+    r, g, b = rgb
+    return f"rgba({r}, {g}, {b}, {alpha:.2f})"
+
+
+_PALETTE = {
     # Backgrounds — layered navy depth
     "bg_deep":          "#050816",       # deepest (main window)
     "bg_dark":          "#0a0e1a",       # panels
     "bg_panel":         "#111827",       # elevated panels
     "bg_card":          "#151c2e",       # card surfaces
     "bg_input":         "#1a2236",       # input fields (visible)
-    "bg_hover":         "rgba(56, 189, 248, 0.10)",
-    "bg_selected":      "rgba(56, 189, 248, 0.18)",
+    "bg_hover":         _rgba(_ACCENT_RGB, 0.10),
+    "bg_selected":      _rgba(_ACCENT_RGB, 0.18),
 
     # Glass surfaces — translucent
-    "glass":            "rgba(21, 28, 46, 0.65)",
-    "glass_border":     "rgba(56, 189, 248, 0.12)",
-    "glass_hover":      "rgba(56, 189, 248, 0.22)",
-    "glass_glow":       "rgba(56, 189, 248, 0.08)",
+    "glass":            _rgba(_CARD_RGB, 0.65),
+    "glass_border":     _rgba(_ACCENT_RGB, 0.12),
+    "glass_hover":      _rgba(_ACCENT_RGB, 0.22),
+    "glass_glow":       _rgba(_ACCENT_RGB, 0.08),
 
     # Borders
-    "border":           "rgba(56, 189, 248, 0.08)",
-    "border_subtle":    "rgba(56, 189, 248, 0.12)",
-    "border_light":     "rgba(56, 189, 248, 0.18)",
-    "border_bright":    "rgba(56, 189, 248, 0.30)",
+    "border":           _rgba(_ACCENT_RGB, 0.08),
+    "border_subtle":    _rgba(_ACCENT_RGB, 0.12),
+    "border_light":     _rgba(_ACCENT_RGB, 0.18),
+    "border_bright":    _rgba(_ACCENT_RGB, 0.30),
 
     # Text — always bright on dark
     "text":             "#e0e7ff",
@@ -46,13 +66,13 @@ COLORS = {
     "accent":           "#38bdf8",
     "accent_hover":     "#7dd3fc",
     "accent_pressed":   "#0ea5e9",
-    "accent_subtle":    "rgba(56, 189, 248, 0.15)",
-    "accent_glow":      "rgba(56, 189, 248, 0.25)",
+    "accent_subtle":    _rgba(_ACCENT_RGB, 0.15),
+    "accent_glow":      _rgba(_ACCENT_RGB, 0.25),
 
     # Secondary — purple
     "secondary":        "#a78bfa",
     "secondary_hover":  "#c4b5fd",
-    "secondary_subtle": "rgba(167, 139, 250, 0.12)",
+    "secondary_subtle": _rgba(_SECONDARY_RGB, 0.12),
 
     # Status
     "danger":           "#f87171",
@@ -61,7 +81,7 @@ COLORS = {
     "success":          "#34d399",
 
     # Track palette — vivid, cool-toned
-    "track_colors": [
+    "track_colors": (
         "#38bdf8",   # Cyan
         "#a78bfa",   # Violet
         "#2dd4bf",   # Teal
@@ -70,91 +90,112 @@ COLORS = {
         "#818cf8",   # Indigo
         "#34d399",   # Emerald
         "#e879f9",   # Fuchsia
-    ],
+    ),
 }
 
+# Read-only view of the palette.  Values are interned so the many widgets
+# styling themselves from it share one string object per color.
+COLORS: Final[Mapping[str, Any]] = MappingProxyType({
+    key: sys.intern(value) if isinstance(value, str)
+    else tuple(sys.intern(c) for c in value)
+    for key, value in _PALETTE.items()
+})
+
+_TRACK_COLORS: Final[tuple[str, ...]] = COLORS["track_colors"]
+# With a power-of-two palette, cycling is a bitmask instead of a modulo
+_TRACK_MASK: Final[Optional[int]] = (
+    len(_TRACK_COLORS) - 1
+    if len(_TRACK_COLORS) & (len(_TRACK_COLORS) - 1) == 0 else None
+)
+
 
 # ---------------------------------------------------------------------------
 #  QSS Stylesheet — Frosted Glass (macOS 26 inspired)
 # ---------------------------------------------------------------------------
 
-STYLESHEET = f"""
+# Stylesheet fragments, in cascade order.  Placeholders are COLORS keys;
+# literal QSS braces are doubled.
+_STYLE_FRAGMENTS = {
+    "base": """\
 /* ===== Global Reset ===== */
 * {{
-    color: {COLORS['text']};
+    color: {text};
     outline: none;
 }}
 
 QWidget {{
-    background-color: {COLORS['bg_deep']};
-    color: {COLORS['text']};
+    background-color: {bg_deep};
+    color: {text};
     font-family: "SF Pro Display", "SF Pro Text", ".AppleSystemUIFont",
                  "Inter", "Segoe UI", "Helvetica Neue", sans-serif;
     font-size: 13px;
-    selection-background-color: {COLORS['accent']};
-    selection-color: #ffffff;
+    /* Highlight roles are set from COLORS on the app palette at startup */
+    selection-background-color: palette(highlight);
+    selection-color: palette(highlighted-text);
 }}
 
 QMainWindow {{
-    background-color: {COLORS['bg_deep']};
+    background-color: {bg_deep};
 }}
-
+""",
+    "menu": """\
 /* ===== Menu Bar — frosted glass ===== */
 QMenuBar {{
-    background-color: {COLORS['bg_panel']};
-    color: {COLORS['text']};
-    border-bottom: 1px solid {COLORS['border_subtle']};
+    background-color: {bg_panel};
+    color: {text};
+    border-bottom: 1px solid {border_subtle};
     padding: 4px 0;
     font-size: 12px;
 }}
 
 QMenuBar::item {{
-    color: {COLORS['text']};
+    color: {text};
     padding: 6px 16px;
     border-radius: 10px;
     margin: 2px 3px;
 }}
 
 QMenuBar::item:selected {{
-    background-color: {COLORS['bg_hover']};
-    color: {COLORS['text_bright']};
+    background-color: {bg_hover};
+    color: {text_bright};
 }}
 
 QMenu {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_card};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 14px;
     padding: 8px 0;
 }}
 
 QMenu::item {{
-    color: {COLORS['text']};
+    color: {text};
     padding: 8px 36px 8px 18px;
     border-radius: 8px;
     margin: 1px 6px;
 }}
 
 QMenu::item:selected {{
-    background-color: {COLORS['bg_hover']};
-    color: {COLORS['text_bright']};
+    background-color: {bg_hover};
+    color: {text_bright};
 }}
 
 QMenu::item:disabled {{
-    color: {COLORS['text_muted']};
+    color: {text_muted};
 }}
 
 QMenu::separator {{
     height: 1px;
-    background: {COLORS['border_subtle']};
+    background: {border_subtle};
     margin: 8px 16px;
 }}
-
+""",
+    "buttons": """\
 /* ===== Buttons — glass pill ===== */
 QPushButton {{
-    background-color: {COLORS['bg_input']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_input};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 12px;
     padding: 8px 20px;
     font-weight: 500;
@@ -164,24 +205,24 @@ QPushButton {{
 
 QPushButton:hover {{
     background-color: rgba(56, 189, 248, 0.08);
-    border-color: {COLORS['accent']};
-    color: {COLORS['text_bright']};
+    border-color: {accent};
+    color: {text_bright};
 }}
 
 QPushButton:pressed {{
     background-color: rgba(56, 189, 248, 0.12);
-    border-color: {COLORS['accent_pressed']};
+    border-color: {accent_pressed};
 }}
 
 QPushButton:disabled {{
-    color: {COLORS['text_muted']};
-    background-color: {COLORS['bg_dark']};
-    border-color: {COLORS['border']};
+    color: {text_muted};
+    background-color: {bg_dark};
+    border-color: {border};
 }}
 
 /* Primary — solid accent pill */
 QPushButton[cssClass="primary"] {{
-    background-color: {COLORS['accent']};
+    background-color: {accent};
     color: #050816;
     border: none;
     font-weight: 700;
@@ -192,21 +233,21 @@ QPushButton[cssClass="primary"] {{
 }}
 
 QPushButton[cssClass="primary"]:hover {{
-    background-color: {COLORS['accent_hover']};
+    background-color: {accent_hover};
 }}
 
 QPushButton[cssClass="primary"]:pressed {{
-    background-color: {COLORS['accent_pressed']};
+    background-color: {accent_pressed};
 }}
 
 QPushButton[cssClass="primary"]:disabled {{
-    background-color: {COLORS['border_subtle']};
-    color: {COLORS['text_muted']};
+    background-color: {border_subtle};
+    color: {text_muted};
 }}
 
 /* Accent — same as primary but smaller */
 QPushButton[cssClass="accent"] {{
-    background-color: {COLORS['accent']};
+    background-color: {accent};
     color: #050816;
     border: none;
     font-weight: 600;
@@ -215,22 +256,22 @@ QPushButton[cssClass="accent"] {{
 }}
 
 QPushButton[cssClass="accent"]:hover {{
-    background-color: {COLORS['accent_hover']};
+    background-color: {accent_hover};
 }}
 
 QPushButton[cssClass="accent"]:pressed {{
-    background-color: {COLORS['accent_pressed']};
+    background-color: {accent_pressed};
 }}
 
 QPushButton[cssClass="accent"]:disabled {{
-    background-color: {COLORS['border_subtle']};
-    color: {COLORS['text_muted']};
+    background-color: {border_subtle};
+    color: {text_muted};
 }}
 
 /* Secondary — outlined purple */
 QPushButton[cssClass="secondary"] {{
-    background-color: {COLORS['secondary_subtle']};
-    color: {COLORS['secondary']};
+    background-color: {secondary_subtle};
+    color: {secondary};
     border: 1px solid rgba(167, 139, 250, 0.25);
     font-weight: 600;
     font-size: 12px;
@@ -241,7 +282,7 @@ QPushButton[cssClass="secondary"] {{
 
 QPushButton[cssClass="secondary"]:hover {{
     background-color: rgba(167, 139, 250, 0.18);
-    color: {COLORS['secondary_hover']};
+    color: {secondary_hover};
     border-color: rgba(167, 139, 250, 0.40);
 }}
 
@@ -251,14 +292,14 @@ QPushButton[cssClass="secondary"]:pressed {{
 
 QPushButton[cssClass="secondary"]:disabled {{
     background-color: transparent;
-    color: {COLORS['text_muted']};
-    border-color: {COLORS['border']};
+    color: {text_muted};
+    border-color: {border};
 }}
 
 /* Danger — ghost red */
 QPushButton[cssClass="danger"] {{
     background-color: transparent;
-    color: {COLORS['danger']};
+    color: {danger};
     border: 1px solid transparent;
     font-weight: 500;
 }}
@@ -266,13 +307,14 @@ QPushButton[cssClass="danger"] {{
 QPushButton[cssClass="danger"]:hover {{
     background-color: rgba(248, 113, 113, 0.10);
     border-color: rgba(248, 113, 113, 0.30);
-    color: {COLORS['danger_hover']};
+    color: {danger_hover};
 }}
 
 QPushButton[cssClass="danger"]:pressed {{
     background-color: rgba(248, 113, 113, 0.18);
 }}
-
+""",
+    "layout": """\
 /* ===== Scroll Area ===== */
 QScrollArea {{
     background-color: transparent;
@@ -285,7 +327,7 @@ QScrollArea > QWidget > QWidget {{
 
 /* ===== Splitter ===== */
 QSplitter::handle {{
-    background-color: {COLORS['border_subtle']};
+    background-color: {border_subtle};
 }}
 
 QSplitter::handle:vertical {{
@@ -296,31 +338,32 @@ QSplitter::handle:vertical {{
 QSplitter::handle:horizontal {{
     width: 1px;
 }}
-
+""",
+    "table": """\
 /* ===== Table Widget — glass panel ===== */
 QTableWidget {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_card};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 16px;
-    gridline-color: {COLORS['border_subtle']};
+    gridline-color: {border_subtle};
     outline: none;
-    alternate-background-color: {COLORS['bg_dark']};
+    alternate-background-color: {bg_dark};
 }}
 
 QTableWidget::item {{
-    color: {COLORS['text']};
+    color: {text};
     padding: 6px 10px;
-    border-bottom: 1px solid {COLORS['border']};
+    border-bottom: 1px solid {border};
 }}
 
 QTableWidget::item:selected {{
-    background-color: {COLORS['bg_selected']};
-    color: {COLORS['text_bright']};
+    background-color: {bg_selected};
+    color: {text_bright};
 }}
 
 QTableWidgetItem {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QHeaderView {{
@@ -328,17 +371,18 @@ QHeaderView {{
 }}
 
 QHeaderView::section {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_dim']};
+    background-color: {bg_card};
+    color: {text_dim};
     border: none;
-    border-bottom: 1px solid {COLORS['border_subtle']};
+    border-bottom: 1px solid {border_subtle};
     padding: 8px 12px;
     font-size: 10px;
     font-weight: 600;
     letter-spacing: 0.8px;
     text-transform: uppercase;
 }}
-
+""",
+    "scrollbar": """\
 /* ===== Scroll Bars — ultra-thin glass ===== */
 QScrollBar:vertical {{
     background-color: transparent;
@@ -385,26 +429,28 @@ QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
     width: 0;
     background: transparent;
 }}
-
+""",
+    "status_bar": """\
 /* ===== Status Bar — subtle glass ===== */
 QStatusBar {{
-    background-color: {COLORS['bg_panel']};
-    border-top: 1px solid {COLORS['border']};
-    color: {COLORS['text_dim']};
+    background-color: {bg_panel};
+    border-top: 1px solid {border};
+    color: {text_dim};
     font-size: 11px;
     padding: 4px 14px;
 }}
 
 QStatusBar QLabel {{
-    color: {COLORS['text_dim']};
+    color: {text_dim};
     background: transparent;
 }}
-
+""",
+    "combo_spin": """\
 /* ===== Combo Box — glass ===== */
 QComboBox {{
-    background-color: {COLORS['bg_input']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_input};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 12px;
     padding: 7px 14px;
     min-height: 20px;
@@ -412,7 +458,7 @@ QComboBox {{
 }}
 
 QComboBox:hover {{
-    border-color: {COLORS['accent']};
+    border-color: {accent};
 }}
 
 QComboBox::drop-down {{
@@ -426,33 +472,33 @@ QComboBox::down-arrow {{
 }}
 
 QComboBox QAbstractItemView {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_card};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 12px;
-    selection-background-color: {COLORS['bg_hover']};
-    selection-color: {COLORS['text_bright']};
+    selection-background-color: {bg_hover};
+    selection-color: {text_bright};
     padding: 6px;
     outline: none;
 }}
 
 QComboBox QAbstractItemView::item {{
-    color: {COLORS['text']};
+    color: {text};
     padding: 6px 12px;
     border-radius: 8px;
     min-height: 24px;
 }}
 
 QComboBox QAbstractItemView::item:selected {{
-    background-color: {COLORS['bg_hover']};
-    color: {COLORS['text_bright']};
+    background-color: {bg_hover};
+    color: {text_bright};
 }}
 
 /* ===== Spin Box — glass ===== */
 QSpinBox, QDoubleSpinBox {{
-    background-color: {COLORS['bg_input']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_input};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 12px;
     padding: 6px 12px;
     font-size: 12px;
@@ -460,11 +506,11 @@ QSpinBox, QDoubleSpinBox {{
 }}
 
 QSpinBox:hover, QDoubleSpinBox:hover {{
-    border-color: {COLORS['accent']};
+    border-color: {accent};
 }}
 
 QSpinBox:focus, QDoubleSpinBox:focus {{
-    border-color: {COLORS['accent']};
+    border-color: {accent};
 }}
 
 QSpinBox::up-button, QSpinBox::down-button,
@@ -481,51 +527,53 @@ QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
 QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
     image: none;
 }}
-
+""",
+    "labels": """\
 /* ===== Labels ===== */
 QLabel {{
     background-color: transparent;
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QLabel[cssClass="heading"] {{
     font-size: 15px;
     font-weight: 600;
-    color: {COLORS['text_bright']};
+    color: {text_bright};
     letter-spacing: -0.3px;
 }}
 
 QLabel[cssClass="dim"] {{
-    color: {COLORS['text_dim']};
+    color: {text_dim};
     font-size: 11px;
 }}
-
+""",
+    "inputs": """\
 /* ===== Line Edit — glass input ===== */
 QLineEdit {{
-    background-color: {COLORS['bg_input']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_input};
+    border: 1px solid {border_light};
     border-radius: 12px;
     padding: 8px 14px;
-    color: {COLORS['text']};
+    color: {text};
     font-size: 12px;
 }}
 
 QLineEdit:focus {{
-    border-color: {COLORS['accent']};
+    border-color: {accent};
 }}
 
 QLineEdit:read-only {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text_dim']};
+    background-color: {bg_dark};
+    color: {text_dim};
 }}
 
 /* ===== Progress Bar — Cyan accent, rounded ===== */
 QProgressBar {{
-    background-color: {COLORS['bg_input']};
+    background-color: {bg_input};
     border: none;
     border-radius: 8px;
     text-align: center;
-    color: {COLORS['text']};
+    color: {text};
     font-size: 11px;
     font-weight: 600;
     min-height: 16px;
@@ -533,139 +581,146 @@ QProgressBar {{
 
 QProgressBar::chunk {{
     background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 {COLORS['accent']}, stop:1 {COLORS['secondary']});
+        stop:0 {accent}, stop:1 {secondary});
     border-radius: 8px;
 }}
-
+""",
+    "dialogs": """\
 /* ===== Dialog — glass ===== */
 QDialog {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text']};
+    background-color: {bg_dark};
+    color: {text};
 }}
 
 /* ===== Message Box — force light text ===== */
 QMessageBox {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text']};
+    background-color: {bg_dark};
+    color: {text};
 }}
 
 QMessageBox QLabel {{
-    color: {COLORS['text']};
+    color: {text};
     font-size: 13px;
     background: transparent;
 }}
 
 QMessageBox QPushButton {{
-    color: {COLORS['text']};
+    color: {text};
     min-width: 80px;
 }}
 
 /* ===== Input Dialog ===== */
 QInputDialog {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text']};
+    background-color: {bg_dark};
+    color: {text};
 }}
 
 QInputDialog QLabel {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QInputDialog QLineEdit {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 /* ===== File Dialog — force colors ===== */
 QFileDialog {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text']};
+    background-color: {bg_dark};
+    color: {text};
 }}
 
 QFileDialog QLabel {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QFileDialog QLineEdit {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QFileDialog QPushButton {{
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 /* ===== Dialog Button Box ===== */
 QDialogButtonBox QPushButton {{
-    color: {COLORS['text']};
+    color: {text};
     min-width: 90px;
     padding: 8px 20px;
 }}
-
+""",
+    "group_box": """\
 /* ===== Group Box — glass card ===== */
 QGroupBox {{
-    background-color: {COLORS['bg_card']};
-    border: 1px solid {COLORS['border_subtle']};
+    background-color: {bg_card};
+    border: 1px solid {border_subtle};
     border-radius: 16px;
     margin-top: 18px;
     padding: 20px 14px 14px;
     font-weight: 600;
     font-size: 12px;
-    color: {COLORS['text']};
+    color: {text};
 }}
 
 QGroupBox::title {{
     subcontrol-origin: margin;
     left: 16px;
     padding: 0 10px;
-    color: {COLORS['text_bright']};
-    background-color: {COLORS['bg_card']};
+    color: {text_bright};
+    background-color: {bg_card};
     border-radius: 6px;
 }}
-
+""",
+    "tooltip": """\
 /* ===== Tool Tips — glass ===== */
 QToolTip {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_card};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 10px;
     padding: 8px 12px;
     font-size: 11px;
 }}
-
+""",
+    "workflow": """\
 /* ===== Workflow Bar — glass panel ===== */
 QWidget[cssClass="workflow-bar"] {{
-    background-color: {COLORS['bg_panel']};
-    border-bottom: 1px solid {COLORS['border_subtle']};
+    background-color: {bg_panel};
+    border-bottom: 1px solid {border_subtle};
 }}
-
+""",
+    "forms": """\
 /* ===== Form Layout Labels ===== */
 QFormLayout QLabel {{
-    color: {COLORS['text']};
+    color: {text};
 }}
-
+""",
+    "tabs": """\
 /* ===== Tab Widget ===== */
 QTabWidget::pane {{
-    background-color: {COLORS['bg_dark']};
-    border: 1px solid {COLORS['border_subtle']};
+    background-color: {bg_dark};
+    border: 1px solid {border_subtle};
     border-radius: 14px;
 }}
 
 QTabBar::tab {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_dim']};
-    border: 1px solid {COLORS['border']};
+    background-color: {bg_card};
+    color: {text_dim};
+    border: 1px solid {border};
     border-radius: 10px;
     padding: 8px 20px;
     margin: 2px;
 }}
 
 QTabBar::tab:selected {{
-    background-color: {COLORS['bg_input']};
-    color: {COLORS['text_bright']};
-    border-color: {COLORS['border_light']};
+    background-color: {bg_input};
+    color: {text_bright};
+    border-color: {border_light};
 }}
-
+""",
+    "checks": """\
 /* ===== Check Box ===== */
 QCheckBox {{
-    color: {COLORS['text']};
+    color: {text};
     spacing: 8px;
 }}
 
@@ -673,18 +728,18 @@ QCheckBox::indicator {{
     width: 18px;
     height: 18px;
     border-radius: 5px;
-    border: 2px solid {COLORS['border_light']};
-    background-color: {COLORS['bg_input']};
+    border: 2px solid {border_light};
+    background-color: {bg_input};
 }}
 
 QCheckBox::indicator:checked {{
-    background-color: {COLORS['accent']};
-    border-color: {COLORS['accent']};
+    background-color: {accent};
+    border-color: {accent};
 }}
 
 /* ===== Radio Button ===== */
 QRadioButton {{
-    color: {COLORS['text']};
+    color: {text};
     spacing: 8px;
 }}
 
@@ -692,51 +747,151 @@ QRadioButton::indicator {{
     width: 18px;
     height: 18px;
     border-radius: 9px;
-    border: 2px solid {COLORS['border_light']};
-    background-color: {COLORS['bg_input']};
+    border: 2px solid {border_light};
+    background-color: {bg_input};
 }}
 
 QRadioButton::indicator:checked {{
-    background-color: {COLORS['accent']};
-    border-color: {COLORS['accent']};
+    background-color: {accent};
+    border-color: {accent};
 }}
-
+""",
+    "text_edit": """\
 /* ===== Text Edit / Plain Text ===== */
 QTextEdit, QPlainTextEdit {{
-    background-color: {COLORS['bg_input']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_light']};
+    background-color: {bg_input};
+    color: {text};
+    border: 1px solid {border_light};
     border-radius: 12px;
     padding: 8px;
 }}
-
+""",
+    "tree_list": """\
 /* ===== List / Tree Views ===== */
 QListView, QTreeView {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text']};
-    border: 1px solid {COLORS['border_subtle']};
+    background-color: {bg_card};
+    color: {text};
+    border: 1px solid {border_subtle};
     border-radius: 12px;
     outline: none;
 }}
 
 QListView::item, QTreeView::item {{
-    color: {COLORS['text']};
+    color: {text};
     padding: 4px 8px;
     border-radius: 6px;
 }}
 
 QListView::item:selected, QTreeView::item:selected {{
-    background-color: {COLORS['bg_selected']};
-    color: {COLORS['text_bright']};
+    background-color: {bg_selected};
+    color: {text_bright};
 }}
 
 QListView::item:hover, QTreeView::item:hover {{
-    background-color: {COLORS['bg_hover']};
+    background-color: {bg_hover};
 }}
-"""
+""",
+}
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_qss(qss: str) -> str:
+    """Drop comments and layout whitespace so Qt tokenizes less."""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    return _QSS_PUNCT_SPACE.sub(r"\1", qss).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def _render_stylesheet(parts: tuple[str, ...]) -> str:
+    qss = "\n".join(_STYLE_FRAGMENTS[p].format_map(COLORS) for p in parts)
+    # AUDIOSYNC_DEBUG_QSS=1 keeps the readable form for inspection
+    if os.environ.get("AUDIOSYNC_DEBUG_QSS"):
+        return qss
+    return _minify_qss(qss)
+
+
+def build_stylesheet(parts: Optional[Iterable[str]] = None) -> str:
+    """
+    Format the stylesheet from COLORS, limited to the named fragments of
+    _STYLE_FRAGMENTS (all of them by default).  Fragments are always
+    emitted in cascade order, whatever order *parts* lists them in.
+    """
+    if parts is None:
+        selected = tuple(_STYLE_FRAGMENTS)
+    else:
+        wanted = set(parts)
+        unknown = wanted.difference(_STYLE_FRAGMENTS)
+        if unknown:
+            raise KeyError(f"Unknown stylesheet fragments: {sorted(unknown)}")
+        selected = tuple(p for p in _STYLE_FRAGMENTS if p in wanted)
+    return _render_stylesheet(selected)
+
+
+def _build_palette():
+    """QPalette matching COLORS, for widgets that draw from palette roles."""
+    from PyQt6.QtGui import QPalette, QColor
+
+    # Force dark palette globally — ensures ALL widgets have light text
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(COLORS["bg_deep"]))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(COLORS["text"]))
+    palette.setColor(QPalette.ColorRole.Base, QColor(COLORS["bg_dark"]))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(COLORS["bg_card"]))
+    palette.setColor(QPalette.ColorRole.Text, QColor(COLORS["text"]))
+    palette.setColor(QPalette.ColorRole.BrightText, QColor(COLORS["text_bright"]))
+    palette.setColor(QPalette.ColorRole.Button, QColor(COLORS["bg_dark"]))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(COLORS["text"]))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(COLORS["accent"]))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(COLORS["bg_card"]))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(COLORS["text"]))
+    palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(COLORS["text_muted"]))
+    palette.setColor(QPalette.ColorRole.Link, QColor(COLORS["accent"]))
+    palette.setColor(QPalette.ColorRole.LinkVisited, QColor(COLORS["secondary"]))
+
+    # Disabled state
+    palette.setColor(
+        QPalette.ColorGroup.Disabled,
+        QPalette.ColorRole.WindowText, QColor(COLORS["text_muted"])
+    )
+    palette.setColor(
+        QPalette.ColorGroup.Disabled,
+        QPalette.ColorRole.Text, QColor(COLORS["text_muted"])
+    )
+    palette.setColor(
+        QPalette.ColorGroup.Disabled,
+        QPalette.ColorRole.ButtonText, QColor(COLORS["text_muted"])
+    )
+
+    return palette
+
+
+def prepare_theme(app) -> None:
+    """Apply the palette and stylesheet to the QApplication *app*."""
+    app.setPalette(_build_palette())
+    app.setStyleSheet(build_stylesheet())
+
+
+if TYPE_CHECKING:
+    STYLESHEET: Final[str]
+
+
+def __getattr__(name: str):
+    # STYLESHEET is built on first access, so importing COLORS or
+    # track_color() alone never formats it.
+    if name == "STYLESHEET":
+        stylesheet = globals()["STYLESHEET"] = build_stylesheet()
+        return stylesheet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def track_color(index: int) -> str:
     """Return a track color by index (cycles through palette)."""
-    colors = COLORS["track_colors"]
-    return colors[index % len(colors)]
+    if _TRACK_MASK is not None:
+        return _TRACK_COLORS[index & _TRACK_MASK]
+    return _TRACK_COLORS[index % len(_TRACK_COLORS)]
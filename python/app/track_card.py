@@ -6,13 +6,18 @@ circular badges, pill-shaped metadata, generous spacing.
 
 from __future__ import annotations
 
+import bisect
+import contextlib
+import functools
+import math
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QSize, QPoint
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QSize, QPoint, QTimer
 from PyQt6.QtGui import (
-    QColor, QFont, QPainter, QPen, QPainterPath, QCursor,
+    QAction, QFont, QPainter, QPen, QPainterPath, QCursor,
     QDragEnterEvent, QDragMoveEvent, QDropEvent, QLinearGradient,
 )
 from PyQt6.QtWidgets import (
@@ -26,10 +31,9 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QVBoxLayout,
     QWidget,
-    QGraphicsDropShadowEffect,
 )
 
-from core.audio_io import AUDIO_EXTENSIONS, VIDEO_EXTENSIONS, is_supported_file
+from core.audio_io import is_supported_file
 from core.models import Clip, Track
 
 from .theme import COLORS, track_color
@@ -39,18 +43,20 @@ from .theme import COLORS, track_color
 #  Helpers
 # ---------------------------------------------------------------------------
 
-def _fmt_duration(seconds: float) -> str:
-    if seconds <= 0:
+# Keyed on whole seconds (callers truncate), so nearby durations share
+# one cache entry
+@functools.lru_cache(maxsize=8192)
+def _fmt_duration(total_s: int) -> str:
+    if total_s <= 0:
         return "0:00"
-    total_s = int(seconds)
-    h = total_s // 3600
-    m = (total_s % 3600) // 60
-    s = total_s % 60
+    m, s = divmod(total_s, 60)
+    h, m = divmod(m, 60)
     if h > 0:
-        return f"{h}:{m:02d}:{s:02d}"
-    return f"{m}:{s:02d}"
+        return "%d:%02d:%02d" % (h, m, s)
+    return "%d:%02d" % (m, s)
 
 
+@functools.lru_cache(maxsize=4096)
 def _fmt_offset(seconds: float) -> str:
     if abs(seconds) < 0.001:
         return "0 ms"
@@ -59,42 +65,234 @@ def _fmt_offset(seconds: float) -> str:
     return f"{seconds:+.2f} s"
 
 
-def _fmt_creation_date(timestamp: float) -> str:
+def _fmt_creation_date(timestamp: float, current_year: Optional[int] = None) -> str:
+    if current_year is None:
+        current_year = datetime.now().year
+    return _fmt_creation_date_cached(timestamp, current_year)
+
+
+# Keyed on the current year too, so "this year" dates drop the year only
+# while it is still this year
+@functools.lru_cache(maxsize=4096)
+def _fmt_creation_date_cached(timestamp: float, current_year: int) -> str:
     try:
-        dt = datetime.fromtimestamp(timestamp)
-        now = datetime.now()
-        if dt.year == now.year:
-            return dt.strftime("%b %d, %I:%M %p")
-        return dt.strftime("%b %d %Y, %I:%M %p")
-    except (ValueError, OSError):
+        local = time.localtime(timestamp)
+        if local.tm_year == current_year:
+            return time.strftime("%b %d, %I:%M %p", local)
+        return time.strftime("%b %d %Y, %I:%M %p", local)
+    except (ValueError, OSError, OverflowError):
         return ""
 
 
 def _get_track_time_span(track: Track) -> str:
-    times = [(c.creation_time, c.duration_s) for c in track.clips if c.creation_time]
-    if not times:
+    earliest = math.inf
+    latest = -math.inf
+    for c in track.clips:
+        ct = c.creation_time
+        if not ct:
+            continue
+        if ct < earliest:
+            earliest = ct
+        end = ct + c.duration_s
+        if end > latest:
+            latest = end
+    if earliest == math.inf:
         return ""
+    return _time_span_for(earliest, latest)
+
+
+@functools.lru_cache(maxsize=1024)
+def _time_span_for(earliest: float, latest: float) -> str:
     try:
-        earliest = min(t[0] for t in times)
-        latest = max(t[0] + t[1] for t in times)
-        dt_start = datetime.fromtimestamp(earliest)
-        dt_end = datetime.fromtimestamp(latest)
-        if dt_start.date() == dt_end.date():
-            return f"{dt_start.strftime('%I:%M')}\u2013{dt_end.strftime('%I:%M %p')}"
-        return f"{dt_start.strftime('%b %d %I:%M')}\u2013{dt_end.strftime('%b %d %I:%M %p')}"
-    except (ValueError, OSError):
+        start = time.localtime(earliest)
+        end = time.localtime(latest)
+        if start[:3] == end[:3]:
+            return f"{time.strftime('%I:%M', start)}\u2013{time.strftime('%I:%M %p', end)}"
+        return (
+            f"{time.strftime('%b %d %I:%M', start)}"
+            f"\u2013{time.strftime('%b %d %I:%M %p', end)}"
+        )
+    except (ValueError, OSError, OverflowError):
         return ""
 
 
-def _glow_shadow(color: str, blur: int = 20, alpha: int = 40) -> QGraphicsDropShadowEffect:
-    """Create a subtle glow shadow effect."""
-    effect = QGraphicsDropShadowEffect()
-    c = QColor(color)
-    c.setAlpha(alpha)
-    effect.setColor(c)
-    effect.setBlurRadius(blur)
-    effect.setOffset(0, 2)
-    return effect
+def _collect_paths(urls) -> list[str]:
+    """Local paths of dropped URLs that point at supported media files."""
+    return [
+        path for url in urls
+        if (path := url.toLocalFile()) and is_supported_file(path)
+    ]
+
+
+# ---------------------------------------------------------------------------
+#  Stylesheets — built once and shared by every card and row
+# ---------------------------------------------------------------------------
+
+_MONO = "font-family: 'SF Mono', 'Menlo', monospace; "
+
+_CLIP_NAME_STYLE = (
+    f"color: {COLORS['text']}; font-size: 12px; font-weight: 500; border: none;"
+)
+_CLIP_DATE_STYLE = f"color: {COLORS['text_muted']}; font-size: 10px; border: none;"
+_CLIP_DURATION_STYLE = (
+    f"color: {COLORS['text_dim']}; font-size: 10px; "
+    f"{_MONO}"
+    f"background: rgba(255,255,255,0.04); border-radius: 8px; "
+    f"padding: 2px 8px; border: none;"
+)
+_CLIP_OFFSET_STYLE = (
+    f"color: {COLORS['text_dim']}; font-size: 10px; "
+    f"{_MONO}border: none;"
+)
+
+_TRACK_NAME_STYLE = (
+    f"color: {COLORS['text_bright']}; font-size: 14px; "
+    f"font-weight: 600; letter-spacing: -0.2px; border: none;"
+)
+_REF_BADGE_STYLE = (
+    f"background: {COLORS['accent_subtle']}; color: {COLORS['accent']}; "
+    f"border-radius: 11px; padding: 2px 10px; "
+    f"font-size: 10px; font-weight: 700; letter-spacing: 0.5px; border: none;"
+)
+_TRACK_INFO_STYLE = (
+    f"color: {COLORS['text_dim']}; font-size: 11px; "
+    f"{_MONO}border: none;"
+)
+_ADD_FILES_BUTTON_STYLE = (
+    f"QPushButton {{ background: rgba(255,255,255,0.05); color: {COLORS['text']}; "
+    f"border: 1px solid {COLORS['border_light']}; border-radius: 14px; "
+    f"padding: 0 14px; font-size: 11px; font-weight: 500; }}"
+    f"QPushButton:hover {{ background: {COLORS['bg_hover']}; "
+    f"border-color: {COLORS['accent']}; color: {COLORS['text_bright']}; }}"
+)
+_MENU_BUTTON_STYLE = (
+    f"QPushButton {{ background: transparent; color: {COLORS['text_dim']}; "
+    f"border: none; border-radius: 14px; font-size: 16px; }}"
+    f"QPushButton:hover {{ background: rgba(255,255,255,0.06); "
+    f"color: {COLORS['text_bright']}; }}"
+)
+_SEPARATOR_STYLE = (
+    f"background: {COLORS['border_subtle']}; "
+    f"border: none; margin: 0 16px;"
+)
+_EMPTY_TRACK_STYLE = (
+    f"color: {COLORS['text_muted']}; font-size: 11px; "
+    f"font-style: italic; padding: 16px; border: none;"
+)
+
+_ADD_TRACK_BUTTON_STYLE = (
+    f"QPushButton {{ background: transparent; color: {COLORS['text_muted']}; "
+    f"border: none; font-size: 12px; font-weight: 500; }}"
+    f"QPushButton:hover {{ color: {COLORS['accent']}; }}"
+)
+_ADD_ZONE_STYLE_TEMPLATE = (
+    "QFrame#AddZone {{ "
+    "background: {bg}; "
+    "border: 1px dashed {border_color}; "
+    "border-radius: 16px; "
+    "}}"
+)
+_ADD_ZONE_STYLE = _ADD_ZONE_STYLE_TEMPLATE.format(bg="transparent", border_color=COLORS["border"])
+_ADD_ZONE_HOVER_STYLE = _ADD_ZONE_STYLE_TEMPLATE.format(
+    bg="rgba(56, 189, 248, 0.05)", border_color=COLORS["accent"],
+)
+
+_PANEL_HEADER_STYLE = (
+    f"color: {COLORS['text_muted']}; font-size: 10px; font-weight: 600; "
+    f"letter-spacing: 1.5px; padding: 6px 12px 2px; background: transparent;"
+)
+
+# Confidence bands: below 3 is a poor match, below 8 fair, otherwise
+# strong.  _CONF_LEVELS[bisect_right(_CONF_THRESHOLDS, conf)] picks one.
+_CONF_THRESHOLDS = (3.0, 8.0)
+_CONF_LEVELS = (
+    ("ClipConfidenceLow", COLORS["warning"]),
+    ("ClipConfidenceMid", COLORS["text_dim"]),
+    ("ClipConfidenceHigh", COLORS["success"]),
+)
+
+_CARD_STYLE_TEMPLATE = (
+    "QFrame#TrackCard {{ "
+    "background: {bg}; "
+    "border: 1px solid {border}; "
+    "border-top: 3px solid {color}; "
+    "border-radius: 16px; "
+    "}}"
+    "QFrame#TrackCardHeader {{ background: transparent; border: none; border-radius: 0; }}"
+    "QFrame#ClipRow {{ "
+    "background: transparent; border: none; border-radius: 10px; "
+    "}}"
+    "QFrame#ClipRow:hover {{ background: rgba(255, 255, 255, 0.04); }}"
+    "QWidget#ClipContainer {{ background: transparent; border: none; border-radius: 0; }}"
+)
+
+
+def _badge_style(badge_bg: str) -> str:
+    return (
+        f"background: {badge_bg}; "
+        f"border-radius: 13px; font-size: 12px; border: none;"
+    )
+
+
+def _confidence_style(conf_color: str) -> str:
+    return (
+        f"color: {conf_color}; font-size: 10px; font-weight: 600; "
+        f"{_MONO}"
+        f"background: {conf_color}15; border-radius: 11px; border: none;"
+    )
+
+
+# One sheet per ClipRow, selecting its labels by object name, so Qt parses
+# a single stylesheet per row instead of one per label
+_CLIP_ROW_STYLE = "".join(
+    f"QLabel#{name} {{ {style} }}"
+    for name, style in (
+        ("ClipBadgeAudio", _badge_style(COLORS["accent_subtle"])),
+        ("ClipBadgeVideo", _badge_style(COLORS["secondary_subtle"])),
+        ("ClipName", _CLIP_NAME_STYLE),
+        ("ClipDate", _CLIP_DATE_STYLE),
+        ("ClipDuration", _CLIP_DURATION_STYLE),
+        ("ClipOffset", _CLIP_OFFSET_STYLE),
+        *((name, _confidence_style(color)) for name, color in _CONF_LEVELS),
+    )
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _card_style(color: str, selected: bool) -> str:
+    if selected:
+        border = "rgba(56, 189, 248, 0.30)"
+        bg = "rgba(21, 28, 46, 0.80)"
+    else:
+        border = COLORS["border_subtle"]
+        bg = "rgba(21, 28, 46, 0.55)"
+    return _CARD_STYLE_TEMPLATE.format(bg=bg, border=border, color=color)
+
+
+# Cards with more clips than this build their rows only once they scroll
+# near the viewport; until then the clip list is an empty block of the
+# same height.
+_EAGER_CLIP_ROWS = 8
+_CLIP_ROW_HEIGHT = 38
+_CLIP_ROW_SPACING = 2
+_CLIP_LIST_MARGINS = (6, 4, 6, 8)
+_QWIDGETSIZE_MAX = (1 << 24) - 1
+
+
+@contextlib.contextmanager
+def _updates_suspended(widget: QWidget):
+    """Hold off repaints of *widget* until a batch of changes is done."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+def _discard(widget: QWidget) -> None:
+    """Detach *widget* from its layout now and delete it later."""
+    widget.setParent(None)
+    widget.deleteLater()
 
 
 # ---------------------------------------------------------------------------
@@ -109,16 +307,19 @@ class ClipRow(QFrame):
     def __init__(
         self, clip: Clip, index: int, color: str,
         parent: Optional[QWidget] = None,
+        current_year: Optional[int] = None,
     ) -> None:
         super().__init__(parent)
         self._clip = clip
         self._index = index
         self._color = color
+        self._shown_key = self._display_key(clip)
+        self._menu: Optional[QMenu] = None
         self.setObjectName("ClipRow")
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_menu)
-        self.setFixedHeight(38)
+        self.setFixedHeight(_CLIP_ROW_HEIGHT)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 0, 10, 0)
@@ -129,73 +330,66 @@ class ClipRow(QFrame):
         badge = QLabel(badge_text)
         badge.setFixedSize(26, 26)
         badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        badge_bg = COLORS["secondary_subtle"] if clip.is_video else COLORS["accent_subtle"]
-        badge.setStyleSheet(
-            f"background: {badge_bg}; "
-            f"border-radius: 13px; font-size: 12px; border: none;"
-        )
+        badge.setObjectName("ClipBadgeVideo" if clip.is_video else "ClipBadgeAudio")
         layout.addWidget(badge)
 
         # File name
         name_lbl = QLabel(clip.name)
-        name_lbl.setStyleSheet(
-            f"color: {COLORS['text']}; font-size: 12px; font-weight: 500; border: none;"
-        )
+        name_lbl.setObjectName("ClipName")
         layout.addWidget(name_lbl, stretch=1)
 
         # Creation date (compact)
         if clip.creation_time:
-            date_lbl = QLabel(_fmt_creation_date(clip.creation_time))
-            date_lbl.setStyleSheet(
-                f"color: {COLORS['text_muted']}; font-size: 10px; border: none;"
-            )
+            date_lbl = QLabel(_fmt_creation_date(clip.creation_time, current_year))
+            date_lbl.setObjectName("ClipDate")
             layout.addWidget(date_lbl)
 
         # Duration pill
-        dur_lbl = QLabel(_fmt_duration(clip.duration_s))
-        dur_lbl.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 10px; "
-            f"font-family: 'SF Mono', 'Menlo', monospace; "
-            f"background: rgba(255,255,255,0.04); border-radius: 8px; "
-            f"padding: 2px 8px; border: none;"
-        )
+        dur_lbl = QLabel(_fmt_duration(int(clip.duration_s)))
+        dur_lbl.setObjectName("ClipDuration")
         layout.addWidget(dur_lbl)
 
         # Analysis results
         if clip.analyzed:
             offset_lbl = QLabel(_fmt_offset(clip.timeline_offset_s))
-            offset_lbl.setStyleSheet(
-                f"color: {COLORS['text_dim']}; font-size: 10px; "
-                f"font-family: 'SF Mono', 'Menlo', monospace; border: none;"
-            )
+            offset_lbl.setObjectName("ClipOffset")
             layout.addWidget(offset_lbl)
 
             # Confidence circle
             conf = clip.confidence
-            if conf < 3.0:
-                conf_color = COLORS["warning"]
-            elif conf < 8.0:
-                conf_color = COLORS["text_dim"]
-            else:
-                conf_color = COLORS["success"]
+            conf_name = _CONF_LEVELS[bisect.bisect_right(_CONF_THRESHOLDS, conf)][0]
 
             conf_lbl = QLabel(f"{conf:.1f}")
             conf_lbl.setFixedSize(32, 22)
             conf_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            conf_lbl.setStyleSheet(
-                f"color: {conf_color}; font-size: 10px; font-weight: 600; "
-                f"font-family: 'SF Mono', 'Menlo', monospace; "
-                f"background: {conf_color}15; border-radius: 11px; border: none;"
-            )
+            conf_lbl.setObjectName(conf_name)
             layout.addWidget(conf_lbl)
 
+        self.setStyleSheet(_CLIP_ROW_STYLE)
         self.setToolTip(clip.file_path)
 
+    @staticmethod
+    def _display_key(clip: Clip) -> tuple:
+        """Everything the row shows, to tell whether it must be recreated."""
+        return (
+            clip.file_path, clip.name, clip.is_video, clip.creation_time,
+            clip.duration_s, clip.analyzed, clip.timeline_offset_s, clip.confidence,
+        )
+
+    def content_key(self) -> tuple:
+        return self._shown_key
+
+    def set_index(self, index: int) -> None:
+        self._index = index
+
     def _show_menu(self, pos: QPoint) -> None:
-        menu = QMenu(self)
-        act = menu.addAction("Remove File")
-        act.triggered.connect(lambda: self.removed.emit(self._index))
-        menu.exec(self.mapToGlobal(pos))
+        if self._menu is None:
+            self._menu = QMenu(self)
+            self._menu.addAction("Remove File", self._on_remove)
+        self._menu.exec(self.mapToGlobal(pos))
+
+    def _on_remove(self) -> None:
+        self.removed.emit(self._index)
 
 
 # ---------------------------------------------------------------------------
@@ -215,24 +409,75 @@ class TrackCard(QFrame):
 
     def __init__(
         self, track: Track, index: int, parent: Optional[QWidget] = None,
+        current_year: Optional[int] = None,
     ) -> None:
         super().__init__(parent)
         self._track = track
         self._index = index
+        self._color = track_color(index)
         self._expanded = True
         self._selected = False
+        self._shown_key: Optional[tuple] = None
+        self._menu: Optional[QMenu] = None
+        self._reference_action: Optional[QAction] = None
         self.setObjectName("TrackCard")
         self.setAcceptDrops(True)
 
-        self._build_ui()
+        self._main_layout = QVBoxLayout(self)
+        self._main_layout.setContentsMargins(0, 0, 0, 0)
+        self._main_layout.setSpacing(0)
 
-    def _build_ui(self) -> None:
-        color = track_color(self._index)
-        track = self._track
+        # --- Clip list (rows are kept across updates) ---
+        self._clip_container = QWidget()
+        self._clip_container.setObjectName("ClipContainer")
+        self._clip_layout = QVBoxLayout(self._clip_container)
+        self._clip_layout.setContentsMargins(*_CLIP_LIST_MARGINS)
+        self._clip_layout.setSpacing(_CLIP_ROW_SPACING)
+        self._main_layout.addWidget(self._clip_container)
+        self._clip_rows: list[ClipRow] = []
+        self._rows_deferred = False
+        self._rows_realized = False
+        self._empty_lbl: Optional[QLabel] = None
+        self._header_widgets: list[QWidget] = []
+
+        self.update_from(track, index, current_year)
+
+    @staticmethod
+    def _display_key(track: Track, index: int) -> tuple:
+        """Everything the card shows, to tell whether it must be rebuilt."""
+        return (
+            index, track.name, track.is_reference,
+            tuple(ClipRow._display_key(c) for c in track.clips),
+        )
+
+    def update_from(
+        self, track: Track, index: int, current_year: Optional[int] = None,
+    ) -> None:
+        """Show *track* at *index*, rebuilding contents only if they changed.
 
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
+        The header is rebuilt on any change; clip rows are recreated only
+        where the clip they show differs.
+        """
+        key = self._display_key(track, index)
+        self._track = track
+        self._index = index
+        self._color = track_color(index)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+
+        with _updates_suspended(self):
+            for widget in self._header_widgets:
+                _discard(widget)
+            self._header_widgets = self._build_header()
+            for i, widget in enumerate(self._header_widgets):
+                self._main_layout.insertWidget(i, widget)
+            self._sync_clip_rows(current_year)
+            self._apply_style()
+
+    def _build_header(self) -> list[QWidget]:
+        color = self._color
+        track = self._track
 
         # --- Header (folder tab) ---
         header = QFrame()
@@ -256,21 +501,14 @@ class TrackCard(QFrame):
         header_layout.addWidget(folder_icon)
 
         name_lbl = QLabel(track.name)
-        name_lbl.setStyleSheet(
-            f"color: {COLORS['text_bright']}; font-size: 14px; "
-            f"font-weight: 600; letter-spacing: -0.2px; border: none;"
-        )
+        name_lbl.setStyleSheet(_TRACK_NAME_STYLE)
         header_layout.addWidget(name_lbl)
 
         # REF badge
         if track.is_reference:
             ref_badge = QLabel("REF")
             ref_badge.setFixedHeight(22)
-            ref_badge.setStyleSheet(
-                f"background: {COLORS['accent_subtle']}; color: {COLORS['accent']}; "
-                f"border-radius: 11px; padding: 2px 10px; "
-                f"font-size: 10px; font-weight: 700; letter-spacing: 0.5px; border: none;"
-            )
+            ref_badge.setStyleSheet(_REF_BADGE_STYLE)
             header_layout.addWidget(ref_badge)
 
         header_layout.addStretch()
@@ -280,7 +518,7 @@ class TrackCard(QFrame):
         if count > 0:
             dur = track.total_duration_s
             info_parts = [f"{count} file{'s' if count != 1 else ''}"]
-            info_parts.append(_fmt_duration(dur))
+            info_parts.append(_fmt_duration(int(dur)))
             time_span = _get_track_time_span(track)
             if time_span:
                 info_parts.append(time_span)
@@ -289,110 +527,142 @@ class TrackCard(QFrame):
             info_text = "Empty"
 
         info_lbl = QLabel(info_text)
-        info_lbl.setStyleSheet(
-            f"color: {COLORS['text_dim']}; font-size: 11px; "
-            f"font-family: 'SF Mono', 'Menlo', monospace; border: none;"
-        )
+        info_lbl.setStyleSheet(_TRACK_INFO_STYLE)
         header_layout.addWidget(info_lbl)
 
         # Add files button — pill
         add_btn = QPushButton("+ Add")
         add_btn.setFixedHeight(28)
-        add_btn.setStyleSheet(
-            f"QPushButton {{ background: rgba(255,255,255,0.05); color: {COLORS['text']}; "
-            f"border: 1px solid {COLORS['border_light']}; border-radius: 14px; "
-            f"padding: 0 14px; font-size: 11px; font-weight: 500; }}"
-            f"QPushButton:hover {{ background: {COLORS['bg_hover']}; "
-            f"border-color: {COLORS['accent']}; color: {COLORS['text_bright']}; }}"
-        )
-        add_btn.clicked.connect(lambda: self.files_requested.emit(self._index))
+        add_btn.setStyleSheet(_ADD_FILES_BUTTON_STYLE)
+        add_btn.clicked.connect(self._on_add_files)
         header_layout.addWidget(add_btn)
 
         # Menu button — circular
         menu_btn = QPushButton("\u22EF")
         menu_btn.setFixedSize(28, 28)
-        menu_btn.setStyleSheet(
-            f"QPushButton {{ background: transparent; color: {COLORS['text_dim']}; "
-            f"border: none; border-radius: 14px; font-size: 16px; }}"
-            f"QPushButton:hover {{ background: rgba(255,255,255,0.06); "
-            f"color: {COLORS['text_bright']}; }}"
-        )
+        menu_btn.setStyleSheet(_MENU_BUTTON_STYLE)
         menu_btn.clicked.connect(self._show_menu)
         header_layout.addWidget(menu_btn)
 
-        main_layout.addWidget(header)
+        widgets: list[QWidget] = [header]
 
         # --- Separator line ---
         if track.clips:
             sep = QFrame()
             sep.setFixedHeight(1)
-            sep.setStyleSheet(
-                f"background: {COLORS['border_subtle']}; "
-                f"border: none; margin: 0 16px;"
-            )
-            main_layout.addWidget(sep)
+            sep.setStyleSheet(_SEPARATOR_STYLE)
+            widgets.append(sep)
+
+        return widgets
+
+    def _sync_clip_rows(self, current_year: Optional[int] = None) -> None:
+        clips = self._track.clips
+        rows = self._clip_rows
+        if self._rows_deferred:
+            self._rows_deferred = False
+            self._clip_container.setMinimumHeight(0)
+            self._clip_container.setMaximumHeight(_QWIDGETSIZE_MAX)
+
+        if not clips:
+            for row in rows:
+                _discard(row)
+            rows.clear()
+            if self._empty_lbl is None:
+                self._empty_lbl = QLabel("Drop files here or click + Add")
+                self._empty_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self._empty_lbl.setStyleSheet(_EMPTY_TRACK_STYLE)
+                self._clip_layout.addWidget(self._empty_lbl)
+            return
 
-        # --- Clip list ---
-        self._clip_container = QWidget()
-        self._clip_container.setObjectName("ClipContainer")
-        clip_layout = QVBoxLayout(self._clip_container)
-        clip_layout.setContentsMargins(6, 4, 6, 8)
-        clip_layout.setSpacing(2)
-
-        if not track.clips:
-            empty_lbl = QLabel("Drop files here or click + Add")
-            empty_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            empty_lbl.setStyleSheet(
-                f"color: {COLORS['text_muted']}; font-size: 11px; "
-                f"font-style: italic; padding: 16px; border: none;"
+        if self._empty_lbl is not None:
+            _discard(self._empty_lbl)
+            self._empty_lbl = None
+
+        if not (self._rows_realized or rows) and len(clips) > _EAGER_CLIP_ROWS:
+            # Reserve the space the rows will take and build them later
+            _, top, _, bottom = _CLIP_LIST_MARGINS
+            self._clip_container.setFixedHeight(
+                top + bottom + len(clips) * (_CLIP_ROW_HEIGHT + _CLIP_ROW_SPACING)
+                - _CLIP_ROW_SPACING
             )
-            clip_layout.addWidget(empty_lbl)
-        else:
-            for i, clip in enumerate(track.clips):
-                row = ClipRow(clip, i, color)
-                row.removed.connect(lambda ci: self.clip_removed.emit(self._index, ci))
-                clip_layout.addWidget(row)
+            self._rows_deferred = True
+            return
 
-        main_layout.addWidget(self._clip_container)
-        self._apply_style()
+        # Pool the existing rows by content so that rows which merely moved
+        # (e.g. after a clip above them was removed) are kept, not rebuilt
+        spare: dict[tuple, list[ClipRow]] = {}
+        for row in rows:
+            spare.setdefault(row.content_key(), []).append(row)
+        while self._clip_layout.count():
+            self._clip_layout.takeAt(0)
+
+        if current_year is None:
+            current_year = datetime.now().year
+        new_rows = []
+        for i, clip in enumerate(clips):
+            matches = spare.get(ClipRow._display_key(clip))
+            if matches:
+                row = matches.pop(0)
+                row.set_index(i)
+            else:
+                row = ClipRow(clip, i, self._color, current_year=current_year)
+                row.removed.connect(self._on_clip_removed)
+            self._clip_layout.addWidget(row)
+            new_rows.append(row)
+        for matches in spare.values():
+            for row in matches:
+                _discard(row)
+        self._clip_rows = new_rows
+
+    def has_deferred_rows(self) -> bool:
+        return self._rows_deferred
+
+    def realize_clip_rows(self) -> None:
+        """Build the clip rows this card has been holding space for."""
+        if not self._rows_deferred:
+            return
+        self._rows_realized = True
+        with _updates_suspended(self):
+            self._sync_clip_rows()
 
     def _apply_style(self) -> None:
-        color = track_color(self._index)
-        if self._selected:
-            border = f"rgba(56, 189, 248, 0.30)"
-            bg = "rgba(21, 28, 46, 0.80)"
-        else:
-            border = COLORS["border_subtle"]
-            bg = "rgba(21, 28, 46, 0.55)"
-
-        self.setStyleSheet(
-            f"QFrame#TrackCard {{ "
-            f"background: {bg}; "
-            f"border: 1px solid {border}; "
-            f"border-top: 3px solid {color}; "
-            f"border-radius: 16px; "
-            f"}}"
-            f"QFrame#TrackCardHeader {{ background: transparent; border: none; border-radius: 0; }}"
-            f"QFrame#ClipRow {{ "
-            f"background: transparent; border: none; border-radius: 10px; "
-            f"}}"
-            f"QFrame#ClipRow:hover {{ background: rgba(255, 255, 255, 0.04); }}"
-            f"QWidget#ClipContainer {{ background: transparent; border: none; border-radius: 0; }}"
-        )
+        self.setStyleSheet(_card_style(self._color, self._selected))
 
     def set_selected(self, selected: bool) -> None:
+        if selected == self._selected:
+            return
         self._selected = selected
         self._apply_style()
 
     def _show_menu(self) -> None:
+        if self._menu is None:
+            self._menu = self._build_menu()
+        self._reference_action.setEnabled(not self._track.is_reference)
+        self._menu.exec(QCursor.pos())
+
+    def _build_menu(self) -> QMenu:
         menu = QMenu(self)
-        menu.addAction("Add Files...", lambda: self.files_requested.emit(self._index))
-        menu.addAction("Rename Track", lambda: self.rename_requested.emit(self._index))
-        ref_act = menu.addAction("Set as Reference", lambda: self.reference_requested.emit(self._index))
-        ref_act.setEnabled(not self._track.is_reference)
+        menu.addAction("Add Files...", self._on_add_files)
+        menu.addAction("Rename Track", self._on_rename)
+        self._reference_action = menu.addAction("Set as Reference", self._on_set_reference)
         menu.addSeparator()
-        menu.addAction("Remove Track", lambda: self.remove_requested.emit(self._index))
-        menu.exec(QCursor.pos())
+        menu.addAction("Remove Track", self._on_remove)
+        return menu
+
+    def _on_add_files(self) -> None:
+        self.files_requested.emit(self._index)
+
+    def _on_rename(self) -> None:
+        self.rename_requested.emit(self._index)
+
+    def _on_set_reference(self) -> None:
+        self.reference_requested.emit(self._index)
+
+    def _on_remove(self) -> None:
+        self.remove_requested.emit(self._index)
+
+    def _on_clip_removed(self, clip_index: int) -> None:
+        self.clip_removed.emit(self._index, clip_index)
 
     def mousePressEvent(self, event) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
@@ -411,11 +681,7 @@ class TrackCard(QFrame):
         self._apply_style()
         if not event.mimeData().hasUrls():
             return
-        paths = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path and is_supported_file(path):
-                paths.append(path)
+        paths = _collect_paths(event.mimeData().urls())
         if paths:
             event.acceptProposedAction()
             self.files_dropped.emit(self._index, paths)
@@ -442,30 +708,14 @@ class _AddZone(QFrame):
         layout.setContentsMargins(0, 0, 0, 0)
 
         btn = QPushButton("+ Add Track")
-        btn.setStyleSheet(
-            f"QPushButton {{ background: transparent; color: {COLORS['text_muted']}; "
-            f"border: none; font-size: 12px; font-weight: 500; }}"
-            f"QPushButton:hover {{ color: {COLORS['accent']}; }}"
-        )
+        btn.setStyleSheet(_ADD_TRACK_BUTTON_STYLE)
         btn.clicked.connect(self.add_track_clicked.emit)
         layout.addWidget(btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
         self._update_style()
 
     def _update_style(self) -> None:
-        if self._hovering:
-            border_color = COLORS["accent"]
-            bg = "rgba(56, 189, 248, 0.05)"
-        else:
-            border_color = COLORS["border"]
-            bg = "transparent"
-        self.setStyleSheet(
-            f"QFrame#AddZone {{ "
-            f"background: {bg}; "
-            f"border: 1px dashed {border_color}; "
-            f"border-radius: 16px; "
-            f"}}"
-        )
+        self.setStyleSheet(_ADD_ZONE_HOVER_STYLE if self._hovering else _ADD_ZONE_STYLE)
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         if event.mimeData().hasUrls():
@@ -482,11 +732,7 @@ class _AddZone(QFrame):
         self._update_style()
         if not event.mimeData().hasUrls():
             return
-        paths = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path and is_supported_file(path):
-                paths.append(path)
+        paths = _collect_paths(event.mimeData().urls())
         if paths:
             event.acceptProposedAction()
             self.files_dropped.emit(paths)
@@ -522,10 +768,7 @@ class TrackPanel(QWidget):
         # Header label
         header = QLabel("  TRACKS")
         header.setFixedHeight(28)
-        header.setStyleSheet(
-            f"color: {COLORS['text_muted']}; font-size: 10px; font-weight: 600; "
-            f"letter-spacing: 1.5px; padding: 6px 12px 2px; background: transparent;"
-        )
+        header.setStyleSheet(_PANEL_HEADER_STYLE)
         outer.addWidget(header)
 
         # Scroll area
@@ -534,6 +777,10 @@ class TrackPanel(QWidget):
         self._scroll.setFrameShape(QFrame.Shape.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        # Card geometry is only final once the scroll range has been updated
+        scroll_bar = self._scroll.verticalScrollBar()
+        scroll_bar.rangeChanged.connect(self._schedule_realize)
+        scroll_bar.valueChanged.connect(self._realize_visible_cards)
 
         self._content = QWidget()
         self._content.setStyleSheet("background: transparent;")
@@ -544,7 +791,7 @@ class TrackPanel(QWidget):
 
         # Add zone
         self._add_zone = _AddZone()
-        self._add_zone.add_track_clicked.connect(lambda: self.add_track())
+        self._add_zone.add_track_clicked.connect(self.add_track)
         self._add_zone.files_dropped.connect(self.files_dropped_on_empty.emit)
         self._layout.addWidget(self._add_zone)
 
@@ -618,31 +865,79 @@ class TrackPanel(QWidget):
     # ----- Internal ----------------------------------------------------------
 
     def _rebuild(self) -> None:
-        for card in self._cards:
+        # Repaint once for the whole pass rather than per card change
+        with _updates_suspended(self._content):
+            self._update_cards()
+
+    def _update_cards(self) -> None:
+        # Reuse cards slot by slot; each one rebuilds its contents only if
+        # what it shows has changed.  Only surplus cards are destroyed.
+        for card in self._cards[len(self._tracks):]:
             self._layout.removeWidget(card)
             card.deleteLater()
-        self._cards.clear()
+        del self._cards[len(self._tracks):]
 
+        current_year = datetime.now().year
         for i, track in enumerate(self._tracks):
-            card = TrackCard(track, i)
-            card.files_requested.connect(self.files_requested.emit)
-            card.remove_requested.connect(self._on_remove_track)
-            card.rename_requested.connect(self._on_rename_track)
-            card.reference_requested.connect(self.set_reference)
-            card.clip_removed.connect(self._on_remove_clip)
-            card.selected.connect(self._on_card_selected)
-            card.files_dropped.connect(self._on_card_files_dropped)
-
-            if i == self._selected_index:
-                card.set_selected(True)
-
-            self._layout.insertWidget(len(self._cards), card)
-            self._cards.append(card)
+            if i < len(self._cards):
+                card = self._cards[i]
+                card.update_from(track, i, current_year)
+            else:
+                card = TrackCard(track, i, current_year=current_year)
+                card.files_requested.connect(self.files_requested.emit)
+                card.remove_requested.connect(self._on_remove_track)
+                card.rename_requested.connect(self._on_rename_track)
+                card.reference_requested.connect(self.set_reference)
+                card.clip_removed.connect(self._on_remove_clip)
+                card.selected.connect(self._on_card_selected)
+                card.files_dropped.connect(self._on_card_files_dropped)
+                self._layout.insertWidget(len(self._cards), card)
+                self._cards.append(card)
+
+            card.set_selected(i == self._selected_index)
+
+        # The scroll range does not change when everything fits, so don't
+        # rely on rangeChanged alone to build newly deferred rows
+        self._schedule_realize()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._schedule_realize()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_realize()
+
+    def _schedule_realize(self) -> None:
+        # Run after pending layout requests so card geometry is up to date
+        QTimer.singleShot(0, self._realize_visible_cards)
+
+    def _realize_visible_cards(self) -> None:
+        """Build clip rows for cards within one viewport of the visible area."""
+        self._layout.activate()
+        if self._content.height() < self._content.minimumSizeHint().height():
+            # Cards are squashed until the scroll area grows the content;
+            # that changes the scroll range and schedules another pass
+            return
+        height = self._scroll.viewport().height()
+        top = self._scroll.verticalScrollBar().value() - height
+        bottom = top + 3 * height
+        for card in self._cards:
+            # Cards just added are shown (and laid out) from the event loop
+            if card.has_deferred_rows() and card.isVisible():
+                geometry = card.geometry()
+                if geometry.bottom() >= top and geometry.top() <= bottom:
+                    card.realize_clip_rows()
 
     def _on_card_selected(self, index: int) -> None:
+        # _rebuild keeps the cards in step with _selected_index, so only
+        # the previously selected card and the new one change state
+        previous = self._selected_index
+        if 0 <= previous < len(self._cards):
+            self._cards[previous].set_selected(False)
+        if 0 <= index < len(self._cards):
+            self._cards[index].set_selected(True)
         self._selected_index = index
-        for i, card in enumerate(self._cards):
-            card.set_selected(i == index)
 
     def _on_remove_track(self, index: int) -> None:
         if 0 <= index < len(self._tracks):
@@ -689,11 +984,7 @@ class TrackPanel(QWidget):
     def dropEvent(self, event: QDropEvent) -> None:
         if not event.mimeData().hasUrls():
             return
-        paths = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path and is_supported_file(path):
-                paths.append(path)
+        paths = _collect_paths(event.mimeData().urls())
         if paths:
             event.acceptProposedAction()
             self.files_dropped_on_empty.emit(paths)
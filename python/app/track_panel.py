@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +28,7 @@ from core.audio_io import AUDIO_EXTENSIONS, VIDEO_EXTENSIONS, is_supported_file
 from core.models import Clip, Track
 
 from .theme import COLORS, track_color
+from .track_card import _fmt_creation_date
 
 
 # ---------------------------------------------------------------------------
@@ -49,6 +51,12 @@ COLUMN_LABELS = ["Name", "Duration", "Offset", "Confidence"]
 # Item data role to tag items
 ROLE_TRACK_IDX = Qt.ItemDataRole.UserRole + 1
 ROLE_IS_TRACK = Qt.ItemDataRole.UserRole + 2
+ROLE_IS_HINT = Qt.ItemDataRole.UserRole + 3
+# Set on collapsed track items whose clip rows have not been built yet
+ROLE_NEEDS_CHILDREN = Qt.ItemDataRole.UserRole + 4
+
+# Every row shares one height so Qt can use uniform-row-height fast paths
+ROW_HEIGHT = 34
 
 
 # ---------------------------------------------------------------------------
@@ -62,6 +70,23 @@ class _TrackCardDelegate(QStyledItemDelegate):
         super().__init__(parent)
         self._tree = tree
 
+    def initStyleOption(self, option: QStyleOptionViewItem, index) -> None:
+        super().initStyleOption(option, index)
+        if index.column() != COL_NAME:
+            return
+        # Per-row font variations live here rather than on the items, so
+        # the model can report a single row height.
+        if index.data(ROLE_IS_TRACK):
+            option.font.setBold(True)
+            option.font.setPointSize(12)
+        elif index.data(ROLE_IS_HINT):
+            option.font.setItalic(True)
+            option.font.setPointSize(10)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        hint = super().sizeHint(option, index)
+        return QSize(hint.width(), ROW_HEIGHT)
+
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
         item = self._tree.itemFromIndex(index)
         if item is None:
@@ -165,10 +190,14 @@ class TrackPanel(QTreeWidget):
         super().__init__(parent)
         self._tracks: list[Track] = []
         self._collapsed_tracks: set[str] = set()   # Track names that are collapsed
+        # Snapshot of the displayed state, used to skip no-op rebuilds
+        self._last_rebuild_fingerprint: Optional[tuple] = None
 
         # Drag-and-drop hover tracking
         self._drop_hover_item: Optional[QTreeWidgetItem] = None
         self._drop_hover_empty: bool = False  # True when hovering over empty space
+        # Row band (viewport rect + scroll position) of the last hit test
+        self._drop_hover_band: Optional[tuple[QRect, int]] = None
 
         # Column setup
         self.setColumnCount(len(COLUMN_LABELS))
@@ -186,6 +215,7 @@ class TrackPanel(QTreeWidget):
         self.setExpandsOnDoubleClick(True)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        self.itemExpanded.connect(self._populate_if_needed)
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
 
@@ -196,7 +226,7 @@ class TrackPanel(QTreeWidget):
         # Tree styling — extra spacing for card look
         self.setIndentation(16)
         self.setAnimated(True)
-        self.setUniformRowHeights(False)
+        self.setUniformRowHeights(True)
 
         # Mono font for numbers — use guaranteed system fonts
         mono = QFont("Menlo", 11)
@@ -251,18 +281,18 @@ class TrackPanel(QTreeWidget):
 
         for t_idx, c_indices in clips_to_remove.items():
             if t_idx not in tracks_to_remove:
-                self._tracks[t_idx].clips = [
-                    c for i, c in enumerate(self._tracks[t_idx].clips)
-                    if i not in c_indices
-                ]
+                self._remove_clip_items(t_idx, c_indices)
 
         for t_idx in sorted(tracks_to_remove, reverse=True):
             if 0 <= t_idx < len(self._tracks):
                 name = self._tracks[t_idx].name
                 self._collapsed_tracks.discard(name)
                 del self._tracks[t_idx]
+                self.takeTopLevelItem(t_idx)
+                self._last_rebuild_fingerprint = None
 
-        self._rebuild_tree()
+        if tracks_to_remove:
+            self._renumber_items(min(tracks_to_remove))
         self.tracks_changed.emit()
 
     def set_reference(self, track_index: int) -> None:
@@ -304,108 +334,169 @@ class TrackPanel(QTreeWidget):
                 if i < len(self._tracks):
                     self._collapsed_tracks.add(self._tracks[i].name)
 
+    def _state_fingerprint(self) -> tuple:
+        """Everything the tree displays, in a cheaply comparable form."""
+        return tuple(
+            (t.name, t.is_reference, tuple(
+                (c.file_path, c.name, c.duration_s, c.creation_time,
+                 c.timeline_offset_s, c.confidence, c.analyzed)
+                for c in t.clips
+            ))
+            for t in self._tracks
+        )
+
     def _rebuild_tree(self) -> None:
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_rebuild_fingerprint:
+            return
+        self._last_rebuild_fingerprint = fingerprint
+
         self._save_expansion_state()
         self.clear()
 
+        # One clock read per rebuild, shared by every clip's date label
+        current_year = datetime.now().year
+
         for i, track in enumerate(self._tracks):
             t_item = QTreeWidgetItem()
-            color = track_color(i)
-
-            # Store metadata for the delegate
-            t_item.setData(0, ROLE_IS_TRACK, True)
-            t_item.setData(0, ROLE_TRACK_IDX, i)
-
-            # Track name with optional [REF] badge
-            label = track.name
-            if track.is_reference:
-                label += "  [REF]"
-            t_item.setText(COL_NAME, f"  {label}")
-            t_item.setForeground(COL_NAME, QColor(color))
-            font = t_item.font(COL_NAME)
-            font.setBold(True)
-            font.setPointSize(12)
-            t_item.setFont(COL_NAME, font)
-
-            # Make track row taller for card look
-            t_item.setSizeHint(COL_NAME, QSize(0, 36))
-
-            # Duration column shows total + file count + time span subtitle
-            dur = track.total_duration_s
-            count = track.clip_count
-            if count > 0:
-                dur_text = f"{_fmt_duration(dur)}  ({count} file{'s' if count != 1 else ''})"
-                # Add time span if metadata available
-                time_span = _get_track_time_span(track)
-                if time_span:
-                    dur_text += f"  {time_span}"
-            else:
-                dur_text = "Empty"
-            t_item.setText(COL_DURATION, dur_text)
-            t_item.setFont(COL_DURATION, self._mono_font)
-            t_item.setForeground(COL_DURATION, QColor(COLORS["text_dim"]))
-
-            t_item.setToolTip(COL_NAME, f"{count} file(s), {_fmt_duration(dur)} total")
-
+            self._fill_track_item(t_item, i, track)
             self.addTopLevelItem(t_item)
 
+            # Restore expansion state.  Collapsed tracks get their clip rows
+            # on first expand (see _populate_if_needed).
+            is_collapsed = track.name in self._collapsed_tracks
             if not track.clips:
-                # Empty-track hint
-                hint = QTreeWidgetItem(t_item)
-                hint.setText(COL_NAME, "    Drop files here or click + Files")
-                hint.setForeground(COL_NAME, QColor(COLORS["text_tertiary"]))
-                hint_font = hint.font(COL_NAME)
-                hint_font.setItalic(True)
-                hint_font.setPointSize(10)
-                hint.setFont(COL_NAME, hint_font)
-                hint.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
-                hint.setData(0, ROLE_IS_TRACK, False)
-                hint.setData(0, ROLE_TRACK_IDX, i)
+                self._add_empty_hint(t_item, i)
+            elif is_collapsed:
+                t_item.setData(0, ROLE_NEEDS_CHILDREN, True)
+                t_item.setChildIndicatorPolicy(
+                    QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+                )
             else:
-                for clip in track.clips:
-                    c_item = QTreeWidgetItem(t_item)
-                    c_item.setData(0, ROLE_IS_TRACK, False)
-                    c_item.setData(0, ROLE_TRACK_IDX, i)
-
-                    # Clip name with [V] or [A] badge + creation date
-                    badge = "[V]" if clip.is_video else "[A]"
-                    date_str = _fmt_creation_date(clip.creation_time) if clip.creation_time else ""
-                    name_text = f"    {badge} {clip.name}"
-                    if date_str:
-                        name_text += f"  \u2022 {date_str}"
-                    c_item.setText(COL_NAME, name_text)
-                    c_item.setForeground(COL_NAME, QColor(COLORS["text"]))
-
-                    c_item.setText(COL_DURATION, _fmt_duration(clip.duration_s))
-                    c_item.setFont(COL_DURATION, self._mono_font)
-                    c_item.setForeground(COL_DURATION, QColor(COLORS["text_dim"]))
-
-                    # Set clip row height
-                    c_item.setSizeHint(COL_NAME, QSize(0, 30))
-
-                    if clip.analyzed:
-                        c_item.setText(COL_OFFSET, _fmt_offset(clip.timeline_offset_s))
-                        c_item.setFont(COL_OFFSET, self._mono_font)
-
-                        conf_text = f"{clip.confidence:.1f}"
-                        c_item.setText(COL_CONFIDENCE, conf_text)
-                        c_item.setFont(COL_CONFIDENCE, self._mono_font)
-                        if clip.confidence < 3.0:
-                            c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["warning"]))
-                        elif clip.confidence < 8.0:
-                            c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["text_dim"]))
-                        else:
-                            c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["success"]))
-
-                    if clip.is_video:
-                        c_item.setToolTip(COL_NAME, f"Video: {clip.file_path}")
-                    else:
-                        c_item.setToolTip(COL_NAME, clip.file_path)
-
-            # Restore expansion state
-            is_collapsed = track.name in self._collapsed_tracks
+                self._build_clip_items(t_item, i, track, current_year)
             t_item.setExpanded(not is_collapsed)
 
+    def _populate_if_needed(self, t_item: QTreeWidgetItem) -> None:
+        """Build the clip rows of a lazily created track on first expand."""
+        if not t_item.data(0, ROLE_NEEDS_CHILDREN):
+            return
+        t_item.setData(0, ROLE_NEEDS_CHILDREN, False)
+        t_item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        )
+        i = self.indexOfTopLevelItem(t_item)
+        if 0 <= i < len(self._tracks):
+            self._build_clip_items(t_item, i, self._tracks[i], datetime.now().year)
+
+    def _fill_track_item(self, t_item: QTreeWidgetItem, i: int, track: Track) -> None:
+        """Set (or refresh) the text, colours and metadata of a track row."""
+        color = track_color(i)
+
+        # Store metadata for the delegate
+        t_item.setData(0, ROLE_IS_TRACK, True)
+        t_item.setData(0, ROLE_TRACK_IDX, i)
+
+        # Track name with optional [REF] badge
+        label = track.name
+        if track.is_reference:
+            label += "  [REF]"
+        t_item.setText(COL_NAME, f"  {label}")
+        t_item.setForeground(COL_NAME, QColor(color))
+
+        # Duration column shows total + file count + time span subtitle
+        dur = track.total_duration_s
+        count = track.clip_count
+        if count > 0:
+            dur_text = f"{_fmt_duration(dur)}  ({count} file{'s' if count != 1 else ''})"
+            # Add time span if metadata available
+            time_span = _get_track_time_span(track)
+            if time_span:
+                dur_text += f"  {time_span}"
+        else:
+            dur_text = "Empty"
+        t_item.setText(COL_DURATION, dur_text)
+        t_item.setFont(COL_DURATION, self._mono_font)
+        t_item.setForeground(COL_DURATION, QColor(COLORS["text_dim"]))
+
+        t_item.setToolTip(COL_NAME, f"{count} file(s), {_fmt_duration(dur)} total")
+
+    def _add_empty_hint(self, t_item: QTreeWidgetItem, i: int) -> None:
+        """Append the non-selectable "drop files here" row to an empty track."""
+        hint = QTreeWidgetItem(t_item)
+        hint.setText(COL_NAME, "    Drop files here or click + Files")
+        hint.setForeground(COL_NAME, QColor(COLORS["text_tertiary"]))
+        hint.setFlags(Qt.ItemFlag.NoItemFlags)  # Non-selectable
+        hint.setData(0, ROLE_IS_TRACK, False)
+        hint.setData(0, ROLE_IS_HINT, True)
+        hint.setData(0, ROLE_TRACK_IDX, i)
+
+    def _build_clip_items(
+        self, t_item: QTreeWidgetItem, i: int, track: Track, current_year: int,
+    ) -> None:
+        """Append one child row per clip of *track* under *t_item*."""
+        for clip in track.clips:
+            c_item = QTreeWidgetItem(t_item)
+            c_item.setData(0, ROLE_IS_TRACK, False)
+            c_item.setData(0, ROLE_TRACK_IDX, i)
+
+            # Clip name with [V] or [A] badge + creation date
+            badge = "[V]" if clip.is_video else "[A]"
+            date_str = (
+                _fmt_creation_date(clip.creation_time, current_year)
+                if clip.creation_time else ""
+            )
+            name_text = f"    {badge} {clip.name}"
+            if date_str:
+                name_text += f"  \u2022 {date_str}"
+            c_item.setText(COL_NAME, name_text)
+            c_item.setForeground(COL_NAME, QColor(COLORS["text"]))
+
+            c_item.setText(COL_DURATION, _fmt_duration(clip.duration_s))
+            c_item.setFont(COL_DURATION, self._mono_font)
+            c_item.setForeground(COL_DURATION, QColor(COLORS["text_dim"]))
+
+            if clip.analyzed:
+                c_item.setText(COL_OFFSET, _fmt_offset(clip.timeline_offset_s))
+                c_item.setFont(COL_OFFSET, self._mono_font)
+
+                conf_text = f"{clip.confidence:.1f}"
+                c_item.setText(COL_CONFIDENCE, conf_text)
+                c_item.setFont(COL_CONFIDENCE, self._mono_font)
+                if clip.confidence < 3.0:
+                    c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["warning"]))
+                elif clip.confidence < 8.0:
+                    c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["text_dim"]))
+                else:
+                    c_item.setForeground(COL_CONFIDENCE, QColor(COLORS["success"]))
+
+            if clip.is_video:
+                c_item.setToolTip(COL_NAME, f"Video: {clip.file_path}")
+            else:
+                c_item.setToolTip(COL_NAME, clip.file_path)
+
+    def _remove_clip_items(self, t_idx: int, c_indices) -> None:
+        """Delete clips from a track and drop their rows, without a rebuild."""
+        self._last_rebuild_fingerprint = None
+        track = self._tracks[t_idx]
+        t_item = self.topLevelItem(t_idx)
+        valid = (i for i in c_indices if 0 <= i < len(track.clips))
+        # Back to front, so earlier runs keep their indices
+        for start, stop in reversed(_contiguous_runs(valid)):
+            del track.clips[start:stop]
+            for c_idx in range(stop - 1, start - 1, -1):
+                t_item.takeChild(c_idx)
+        if not track.clips:
+            self._add_empty_hint(t_item, t_idx)
+        self._fill_track_item(t_item, t_idx, track)
+
+    def _renumber_items(self, start: int = 0) -> None:
+        """Refresh index-dependent data (colour, track index) from *start* on."""
+        for i in range(start, self.topLevelItemCount()):
+            t_item = self.topLevelItem(i)
+            self._fill_track_item(t_item, i, self._tracks[i])
+            for j in range(t_item.childCount()):
+                t_item.child(j).setData(0, ROLE_TRACK_IDX, i)
+
     # ----- context menu -----------------------------------------------------
 
     def _show_context_menu(self, pos) -> None:
@@ -477,13 +568,13 @@ class TrackPanel(QTreeWidget):
     def _remove_clip(self, track_index: int, clip_index: int) -> None:
         track = self._tracks[track_index]
         if 0 <= clip_index < len(track.clips):
-            del track.clips[clip_index]
-            self._rebuild_tree()
+            self._remove_clip_items(track_index, (clip_index,))
             self.tracks_changed.emit()
 
     # ----- drag-and-drop with hover feedback --------------------------------
 
     def dragEnterEvent(self, event) -> None:
+        self._drop_hover_band = None
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
 
@@ -493,7 +584,22 @@ class TrackPanel(QTreeWidget):
 
         event.acceptProposedAction()
 
-        item = self.itemAt(event.position().toPoint())
+        # While the cursor stays within the last hit row (across all
+        # columns) at the same scroll position, the hovered track is the same.
+        pos = event.position().toPoint()
+        scroll = self.verticalScrollBar().value()
+        band = self._drop_hover_band
+        if band is not None and band[1] == scroll and band[0].contains(pos):
+            return
+
+        item = self.itemAt(pos)
+        if item is not None:
+            # visualItemRect covers column 0 only; widen it to the whole row
+            rect = self.visualItemRect(item)
+            row = QRect(0, rect.top(), self.viewport().width(), rect.height())
+            self._drop_hover_band = (row, scroll)
+        else:
+            self._drop_hover_band = None
         old_hover = self._drop_hover_item
         old_empty = self._drop_hover_empty
 
@@ -513,23 +619,23 @@ class TrackPanel(QTreeWidget):
     def dragLeaveEvent(self, event) -> None:
         self._drop_hover_item = None
         self._drop_hover_empty = False
+        self._drop_hover_band = None
         self.viewport().update()
 
     def dropEvent(self, event: QDropEvent) -> None:
         # Reset hover state
         self._drop_hover_item = None
         self._drop_hover_empty = False
+        self._drop_hover_band = None
         self.viewport().update()
 
         if not event.mimeData().hasUrls():
             return
 
-        paths = []
-        for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            if path and is_supported_file(path):
-                paths.append(path)
-
+        paths = [
+            path for url in event.mimeData().urls()
+            if (path := url.toLocalFile()) and is_supported_file(path)
+        ]
         if not paths:
             return
 
@@ -622,28 +728,41 @@ def _fmt_offset(seconds: float) -> str:
     return f"{seconds:+.2f} s"
 
 
-def _fmt_creation_date(timestamp: float) -> str:
-    """Format a Unix timestamp into a concise readable date/time."""
-    try:
-        dt = datetime.fromtimestamp(timestamp)
-        now = datetime.now()
-        if dt.year == now.year:
-            return dt.strftime("%b %d, %I:%M %p")
-        return dt.strftime("%b %d %Y, %I:%M %p")
-    except (ValueError, OSError):
-        return ""
+def _contiguous_runs(indices) -> list[tuple[int, int]]:
+    """Group indices into sorted, half-open (start, stop) runs."""
+    runs = []
+    for _, group in groupby(enumerate(sorted(indices)), key=lambda p: p[1] - p[0]):
+        run = [idx for _, idx in group]
+        runs.append((run[0], run[-1] + 1))
+    return runs
+
+
+def _track_time_bounds(track: Track) -> Optional[tuple[float, float]]:
+    """Return (earliest start, latest end) from clip metadata in one pass."""
+    earliest: Optional[float] = None
+    latest: Optional[float] = None
+    for c in track.clips:
+        t = c.creation_time
+        if not t:
+            continue
+        end = t + c.duration_s
+        if earliest is None or t < earliest:
+            earliest = t
+        if latest is None or end > latest:
+            latest = end
+    if earliest is None or latest is None:
+        return None
+    return earliest, latest
 
 
 def _get_track_time_span(track: Track) -> str:
     """Get a formatted time span string for a track from metadata."""
-    times = [(c.creation_time, c.duration_s) for c in track.clips if c.creation_time]
-    if not times:
+    bounds = _track_time_bounds(track)
+    if bounds is None:
         return ""
     try:
-        earliest = min(t[0] for t in times)
-        latest = max(t[0] + t[1] for t in times)
-        dt_start = datetime.fromtimestamp(earliest)
-        dt_end = datetime.fromtimestamp(latest)
+        dt_start = datetime.fromtimestamp(bounds[0])
+        dt_end = datetime.fromtimestamp(bounds[1])
         if dt_start.date() == dt_end.date():
             return f"{dt_start.strftime('%I:%M')}\u2013{dt_end.strftime('%I:%M %p')}"
         return f"{dt_start.strftime('%b %d %I:%M')}\u2013{dt_end.strftime('%b %d %I:%M %p')}"
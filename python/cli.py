@@ -20,19 +20,26 @@ Usage examples:
 """
 
 import argparse
+import io
 import json
 import logging
+import math
 import os
 import sys
 import time
-from pathlib import Path
-from threading import Event
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+
+try:
+    import orjson
+except ImportError:  # optional speed-up for --json output
+    orjson = None
 
 # Add this directory to path so core/ imports work
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from version import __version__, APP_NAME
-from core.models import SyncConfig, Track
+from core.models import ANALYSIS_SR, Clip, SyncConfig, Track
 from core.audio_io import (
     load_clip,
     export_track,
@@ -41,7 +48,7 @@ from core.audio_io import (
 )
 from core.engine import analyze, sync, measure_drift, compute_delay
 from core.grouping import group_files_by_device
-from core.metadata import probe_creation_time
+from core.metadata import probe_creation_times
 
 
 logger = logging.getLogger("audiosync.cli")
@@ -51,41 +58,145 @@ logger = logging.getLogger("audiosync.cli")
 #  Helpers
 # ---------------------------------------------------------------------------
 
+class _BatchedStderrHandler(logging.StreamHandler):
+    """Log handler that batches writes to stderr.
+
+    Records go to a block-buffered text stream over stderr's file
+    descriptor, flushed every *capacity* records, on WARNING and above, and
+    before the CLI's own stderr output (see :func:`_flush_logs`).  The final
+    flush at exit comes from ``logging.shutdown``, which logging registers
+    with atexit, so no hook of our own is needed.  ``sys.stderr`` itself is
+    line-buffered, so a plain StreamHandler costs one write per record.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        stream = open(
+            sys.stderr.fileno(), "w",
+            buffering=io.DEFAULT_BUFFER_SIZE,
+            encoding=sys.stderr.encoding,
+            errors="backslashreplace",
+            closefd=False,
+        )
+        super().__init__(stream)
+        self._capacity = capacity
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending += 1
+        if record.levelno >= logging.WARNING or self._pending >= self._capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        self._pending = 0
+        super().flush()
+
+
 def _setup_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
+    try:
+        handler = _BatchedStderrHandler()
+    except (AttributeError, OSError, ValueError):
+        # stderr has no usable file descriptor (e.g. redirected in-process)
+        handler = logging.StreamHandler(sys.stderr)
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
         datefmt="%H:%M:%S",
-        stream=sys.stderr,
+        handlers=[handler],
     )
 
 
-def _progress_callback(current: int, total: int, message: str) -> None:
-    """Print progress to stderr."""
-    pct = int(current / total * 100) if total > 0 else 0
-    print(f"\r  [{pct:3d}%] {message}", end="", flush=True, file=sys.stderr)
-    if current >= total:
-        print(file=sys.stderr)
+def _flush_logs() -> None:
+    """Write out batched log records before printing directly to stderr."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def _eprint(*args) -> None:
+    """Print a CLI message to stderr, after any batched log records."""
+    _flush_logs()
+    print(*args, file=sys.stderr)
+
+
+class _ProgressPrinter:
+    """Progress callback that prints to stderr at most every *min_interval* s.
+
+    The final update of a run (current >= total) is always printed.
+    """
+
+    def __init__(self, min_interval: float = 0.05) -> None:
+        self._min_interval = min_interval
+        self._last = -math.inf
+
+    def __call__(self, current: int, total: int, message: str) -> None:
+        done = current >= total
+        now = time.monotonic()
+        if not done and now - self._last < self._min_interval:
+            return
+        # After a run finishes, let the next one's first update through
+        self._last = -math.inf if done else now
+        pct = int(current / total * 100) if total > 0 else 0
+        _flush_logs()
+        sys.stderr.write("\r  [%3d%%] %s" % (pct, message))
+        if done:
+            sys.stderr.write("\n")
+        sys.stderr.flush()
+
+
+_progress_callback = _ProgressPrinter()
+
+
+_print_lock = Lock()
+
+
+def _load_clips(jobs: list[tuple[str, str]], cancel: Event) -> list[Clip]:
+    """Load ``(path, message)`` jobs in parallel, returning clips in job order.
+
+    Decoding is dominated by ffmpeg and disk I/O, so files load on a small
+    thread pool; each job's message is printed as its load starts.
+    """
+    def load(path: str, message: str) -> Clip:
+        with _print_lock:
+            _eprint(message)
+        return load_clip(path, cancel)
+
+    workers = max(1, min(8, os.cpu_count() or 1, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(load, path, message) for path, message in jobs]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            # Stop loads in flight (they poll *cancel*) and drop queued ones
+            cancel.set()
+            for future in futures:
+                future.cancel()
+            raise
 
 
 def _load_tracks_auto(file_paths: list[str], cancel: Event) -> list[Track]:
     """Load files and auto-group into tracks by device name."""
     valid = [p for p in file_paths if is_supported_file(p)]
     if not valid:
-        print("Error: No supported audio/video files found.", file=sys.stderr)
+        _eprint("Error: No supported audio/video files found.")
         sys.exit(1)
 
     groups = group_files_by_device(valid)
-    tracks = []
-
-    for device_name, paths in groups.items():
-        track = Track(name=device_name)
-        for path in paths:
-            print(f"  Loading {Path(path).name}...", file=sys.stderr)
-            clip = load_clip(path, cancel)
-            track.clips.append(clip)
-        tracks.append(track)
+    tracks = [Track(name=device_name) for device_name in groups]
+    jobs = [
+        (track, path)
+        for track, paths in zip(tracks, groups.values())
+        for path in paths
+    ]
+    clips = _load_clips(
+        [(path, f"  Loading {os.path.basename(path)}...") for _, path in jobs], cancel,
+    )
+    for (track, _), clip in zip(jobs, clips):
+        track.clips.append(clip)
 
     return tracks
 
@@ -96,18 +207,48 @@ def _load_tracks_manual(
 ) -> list[Track]:
     """Load files into manually specified tracks."""
     tracks = []
+    jobs = []
     for name, paths in track_specs:
         track = Track(name=name)
+        tracks.append(track)
         for path in paths:
             if not is_supported_file(path):
-                print(f"  Warning: Skipping unsupported file: {path}", file=sys.stderr)
+                _eprint(f"  Warning: Skipping unsupported file: {path}")
                 continue
-            print(f"  Loading {Path(path).name} → {name}...", file=sys.stderr)
-            clip = load_clip(path, cancel)
-            track.clips.append(clip)
-        if track.clips:
-            tracks.append(track)
-    return tracks
+            jobs.append((track, path))
+
+    clips = _load_clips(
+        [(path, f"  Loading {os.path.basename(path)} → {track.name}...")
+         for track, path in jobs],
+        cancel,
+    )
+    for (track, _), clip in zip(jobs, clips):
+        track.clips.append(clip)
+    return [track for track in tracks if track.clips]
+
+
+def _write_json(obj) -> None:
+    """Pretty-print *obj* as JSON on stdout.
+
+    Uses orjson to write bytes straight to the stdout buffer when it is
+    installed, otherwise streams through the stdlib encoder.  Both accept
+    NumPy scalars such as the drift values and write the same bytes:
+    UTF-8 with non-ASCII names unescaped and ``\\n`` line endings.
+    """
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                  | orjson.OPT_SERIALIZE_NUMPY)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=option))
+        sys.stdout.buffer.flush()
+        return
+    sys.stdout.flush()
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n")
+    try:
+        json.dump(obj, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+    finally:
+        out.detach()
 
 
 def _format_result(tracks: list[Track], result) -> dict:
@@ -151,15 +292,17 @@ def cmd_analyze(args: argparse.Namespace) -> None:
     cancel = Event()
     config = SyncConfig(
         max_offset_s=args.max_offset,
+        release_samples=True,
+        use_gpu=args.gpu,
     )
 
-    print(f"AudioSync Pro {__version__} — Analyze", file=sys.stderr)
-    print(f"Loading {len(args.files)} file(s)...", file=sys.stderr)
+    _eprint(f"AudioSync Pro {__version__} — Analyze")
+    _eprint(f"Loading {len(args.files)} file(s)...")
 
     tracks = _load_tracks_auto(args.files, cancel)
 
-    print(f"Analyzing {sum(t.clip_count for t in tracks)} clips across "
-          f"{len(tracks)} tracks...", file=sys.stderr)
+    _eprint(f"Analyzing {sum(t.clip_count for t in tracks)} clips across "
+            f"{len(tracks)} tracks...")
 
     t0 = time.time()
     result = analyze(tracks, config, progress_callback=_progress_callback, cancel=cancel)
@@ -168,25 +311,25 @@ def cmd_analyze(args: argparse.Namespace) -> None:
     if args.json:
         output = _format_result(tracks, result)
         output["elapsed_s"] = round(elapsed, 2)
-        print(json.dumps(output, indent=2))
+        _write_json(output)
     else:
-        print(f"\nAnalysis complete in {elapsed:.1f}s", file=sys.stderr)
-        print(f"  Timeline: {result.total_timeline_s:.1f}s", file=sys.stderr)
-        print(f"  Avg confidence: {result.avg_confidence:.1f}", file=sys.stderr)
-        print(f"  Drift detected: {result.drift_detected}", file=sys.stderr)
+        _eprint(f"\nAnalysis complete in {elapsed:.1f}s")
+        _eprint(f"  Timeline: {result.total_timeline_s:.1f}s")
+        _eprint(f"  Avg confidence: {result.avg_confidence:.1f}")
+        _eprint(f"  Drift detected: {result.drift_detected}")
 
         for i, track in enumerate(tracks):
             ref = " [REF]" if track.is_reference else ""
-            print(f"\n  Track {i + 1}: {track.name}{ref}", file=sys.stderr)
+            _eprint(f"\n  Track {i + 1}: {track.name}{ref}")
             for clip in track.clips:
                 drift_str = f", drift {clip.drift_ppm:+.2f} ppm" if abs(clip.drift_ppm) > 0.01 else ""
-                print(f"    {clip.name}: offset {clip.timeline_offset_s:.3f}s, "
-                      f"confidence {clip.confidence:.1f}{drift_str}", file=sys.stderr)
+                _eprint(f"    {clip.name}: offset {clip.timeline_offset_s:.3f}s, "
+                        f"confidence {clip.confidence:.1f}{drift_str}")
 
         if result.warnings:
-            print(f"\nWarnings:", file=sys.stderr)
+            _eprint(f"\nWarnings:")
             for w in result.warnings:
-                print(f"  ⚠ {w}", file=sys.stderr)
+                _eprint(f"  ⚠ {w}")
 
 
 def cmd_sync(args: argparse.Namespace) -> None:
@@ -197,20 +340,22 @@ def cmd_sync(args: argparse.Namespace) -> None:
         export_format=args.format,
         export_bit_depth=args.bit_depth,
         drift_correction=not args.no_drift_correction,
+        release_samples=True,
+        use_gpu=args.gpu,
     )
 
-    print(f"AudioSync Pro {__version__} — Sync & Export", file=sys.stderr)
-    print(f"Loading {len(args.files)} file(s)...", file=sys.stderr)
+    _eprint(f"AudioSync Pro {__version__} — Sync & Export")
+    _eprint(f"Loading {len(args.files)} file(s)...")
 
     tracks = _load_tracks_auto(args.files, cancel)
 
-    print(f"Analyzing {sum(t.clip_count for t in tracks)} clips across "
-          f"{len(tracks)} tracks...", file=sys.stderr)
+    _eprint(f"Analyzing {sum(t.clip_count for t in tracks)} clips across "
+            f"{len(tracks)} tracks...")
 
     t0 = time.time()
     result = analyze(tracks, config, progress_callback=_progress_callback, cancel=cancel)
 
-    print(f"\nSyncing and exporting...", file=sys.stderr)
+    _eprint(f"\nSyncing and exporting...")
     sync(tracks, result, config, progress_callback=_progress_callback, cancel=cancel)
 
     # Export
@@ -219,12 +364,14 @@ def cmd_sync(args: argparse.Namespace) -> None:
 
     ext = config.export_format.lower()
     exported = []
+    # One track at a time: export_track holds a clipped copy of the whole
+    # timeline, and tracks with the same name share an output file
     for track in tracks:
         filename = f"{track.name}.{ext}"
         output_path = os.path.join(output_dir, filename)
         export_track(track, output_path, config)
         exported.append(output_path)
-        print(f"  Exported: {output_path}", file=sys.stderr)
+        _eprint(f"  Exported: {output_path}")
 
     elapsed = time.time() - t0
 
@@ -232,23 +379,20 @@ def cmd_sync(args: argparse.Namespace) -> None:
         output = _format_result(tracks, result)
         output["elapsed_s"] = round(elapsed, 2)
         output["exported_files"] = exported
-        print(json.dumps(output, indent=2))
+        _write_json(output)
     else:
-        print(f"\nDone in {elapsed:.1f}s — {len(exported)} files exported to {output_dir}",
-              file=sys.stderr)
+        _eprint(f"\nDone in {elapsed:.1f}s — {len(exported)} files exported to {output_dir}")
 
 
 def cmd_drift(args: argparse.Namespace) -> None:
     """Measure or correct clock drift between two files."""
-    from core.models import ANALYSIS_SR
-
     cancel = Event()
 
-    print(f"AudioSync Pro {__version__} — Drift Measurement", file=sys.stderr)
+    _eprint(f"AudioSync Pro {__version__} — Drift Measurement")
 
-    print(f"  Loading reference: {args.reference}...", file=sys.stderr)
+    _eprint(f"  Loading reference: {args.reference}...")
     ref_clip = load_clip(args.reference, cancel)
-    print(f"  Loading target: {args.target}...", file=sys.stderr)
+    _eprint(f"  Loading target: {args.target}...")
     tgt_clip = load_clip(args.target, cancel)
 
     # First, find the delay
@@ -259,65 +403,63 @@ def cmd_drift(args: argparse.Namespace) -> None:
     tgt_clip.timeline_offset_s = delay / ANALYSIS_SR
     tgt_clip.confidence = conf
 
-    # Build a simple reference timeline
-    ref_audio = ref_clip.samples.copy()
-
-    # Measure drift
-    drift_ppm, r_squared = measure_drift(ref_audio, tgt_clip, ANALYSIS_SR)
+    # The reference clip is the whole timeline; measure_drift only reads it
+    drift_ppm, r_squared = measure_drift(ref_clip.samples, tgt_clip, ANALYSIS_SR)
 
     if args.json:
-        print(json.dumps({
+        _write_json({
             "reference": args.reference,
             "target": args.target,
             "offset_s": round(delay / ANALYSIS_SR, 6),
             "confidence": round(conf, 2),
             "drift_ppm": round(drift_ppm, 3),
             "drift_r_squared": round(r_squared, 4),
-        }, indent=2))
+        })
     else:
-        print(f"\n  Offset: {delay / ANALYSIS_SR:.6f}s ({delay} samples @ {ANALYSIS_SR} Hz)",
-              file=sys.stderr)
-        print(f"  Confidence: {conf:.1f}", file=sys.stderr)
-        print(f"  Drift: {drift_ppm:+.3f} ppm (R² = {r_squared:.4f})", file=sys.stderr)
+        _eprint(f"\n  Offset: {delay / ANALYSIS_SR:.6f}s ({delay} samples @ {ANALYSIS_SR} Hz)")
+        _eprint(f"  Confidence: {conf:.1f}")
+        _eprint(f"  Drift: {drift_ppm:+.3f} ppm (R² = {r_squared:.4f})")
 
         if abs(drift_ppm) > 0.3 and r_squared > 0.5:
-            print(f"  Status: Significant drift detected", file=sys.stderr)
+            _eprint(f"  Status: Significant drift detected")
         else:
-            print(f"  Status: No significant drift", file=sys.stderr)
+            _eprint(f"  Status: No significant drift")
 
 
 def cmd_info(args: argparse.Namespace) -> None:
     """Show file info and auto-grouping."""
     valid = [p for p in args.files if is_supported_file(p)]
     if not valid:
-        print("No supported files found.", file=sys.stderr)
+        _eprint("No supported files found.")
         sys.exit(1)
 
     groups = group_files_by_device(valid)
+    creation_times = probe_creation_times(valid)
 
     if args.json:
-        output = {"groups": {}}
-        for name, paths in groups.items():
-            files = []
-            for p in paths:
-                ct = probe_creation_time(p)
-                files.append({
-                    "path": os.path.abspath(p),
-                    "name": Path(p).name,
-                    "creation_time": ct,
-                })
-            output["groups"][name] = files
-        print(json.dumps(output, indent=2))
+        # os.path.abspath() re-reads the cwd per call; read it once instead
+        cwd = os.getcwd()
+        output = {"groups": {
+            name: [
+                {
+                    "path": os.path.normpath(os.path.join(cwd, p)),
+                    "name": os.path.basename(p),
+                    "creation_time": creation_times[p],
+                }
+                for p in paths
+            ]
+            for name, paths in groups.items()
+        }}
+        _write_json(output)
     else:
-        print(f"AudioSync Pro {__version__} — File Info", file=sys.stderr)
-        print(f"Found {len(valid)} supported file(s) in {len(groups)} group(s):\n",
-              file=sys.stderr)
+        _eprint(f"AudioSync Pro {__version__} — File Info")
+        _eprint(f"Found {len(valid)} supported file(s) in {len(groups)} group(s):\n")
         for name, paths in groups.items():
-            print(f"  Track: {name} ({len(paths)} files)", file=sys.stderr)
+            _eprint(f"  Track: {name} ({len(paths)} files)")
             for p in paths:
-                ct = probe_creation_time(p)
+                ct = creation_times[p]
                 ct_str = f" (created: {ct:.0f})" if ct else ""
-                print(f"    {Path(p).name}{ct_str}", file=sys.stderr)
+                _eprint(f"    {os.path.basename(p)}{ct_str}")
 
 
 # ---------------------------------------------------------------------------
@@ -339,6 +481,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_analyze.add_argument("files", nargs="+", help="Audio/video files to analyze")
     p_analyze.add_argument("--max-offset", type=float, default=None,
                            help="Maximum offset in seconds (default: no limit)")
+    p_analyze.add_argument("--gpu", action="store_true",
+                           help="Correlate on a CUDA GPU via CuPy, if installed")
     p_analyze.add_argument("--json", action="store_true",
                            help="Output results as JSON to stdout")
     p_analyze.add_argument("-v", "--verbose", action="store_true")
@@ -356,6 +500,8 @@ def build_parser() -> argparse.ArgumentParser:
                         help="Maximum offset in seconds (default: no limit)")
     p_sync.add_argument("--no-drift-correction", action="store_true",
                         help="Disable automatic clock drift correction")
+    p_sync.add_argument("--gpu", action="store_true",
+                        help="Correlate on a CUDA GPU via CuPy, if installed")
     p_sync.add_argument("--json", action="store_true",
                         help="Output results as JSON to stdout")
     p_sync.add_argument("-v", "--verbose", action="store_true")
@@ -396,11 +542,11 @@ def main() -> None:
     try:
         commands[args.command](args)
     except KeyboardInterrupt:
-        print("\nCancelled.", file=sys.stderr)
+        _eprint("\nCancelled.")
         sys.exit(130)
     except Exception as exc:
         logger.error("Error: %s", exc, exc_info=True)
-        print(f"\nError: {exc}", file=sys.stderr)
+        _eprint(f"\nError: {exc}")
         sys.exit(1)
 
 
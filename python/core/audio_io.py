@@ -59,8 +59,11 @@ def is_video_file(path: str) -> bool:
     return Path(path).suffix.lower() in VIDEO_EXTENSIONS
 
 
+_SUPPORTED_EXTENSIONS = frozenset(AUDIO_EXTENSIONS | VIDEO_EXTENSIONS)
+
+
 def is_supported_file(path: str) -> bool:
-    return is_audio_file(path) or is_video_file(path)
+    return os.path.splitext(path)[1].lower() in _SUPPORTED_EXTENSIONS
 
 
 # ---------------------------------------------------------------------------
@@ -448,7 +451,7 @@ def load_clip(
     return Clip(
         file_path=path,
         name=name,
-        samples=data.astype(np.float32),
+        samples=data.astype(np.float32, copy=False),
         sample_rate=ANALYSIS_SR,
         original_sr=orig_sr,
         original_channels=orig_channels,
@@ -469,7 +472,7 @@ def read_clip_full_res(
 ) -> np.ndarray:
     """
     Re-read a clip's original file at full resolution, resampled to
-    *target_sr*.  Returns a multi-channel float64 array.
+    *target_sr*.  Returns a multi-channel float32 array.
     Used only during export — never kept in memory during analysis.
     """
     if clip.is_video:
@@ -482,7 +485,7 @@ def read_clip_full_res(
             _evict_lru(target_free=200 * 1024 * 1024)  # Reserve 200 MB for full-res
             _extract_audio_full_quality(clip.file_path, cached_full, target_sr, cancel)
 
-        data, sr = sf.read(cached_full, dtype="float64")
+        data, sr = sf.read(cached_full, dtype="float32")
 
         # Clean up immediately — we read it, no need to keep on disk
         try:
@@ -490,7 +493,7 @@ def read_clip_full_res(
         except OSError:
             pass
     else:
-        data, sr = sf.read(clip.file_path, dtype="float64")
+        data, sr = sf.read(clip.file_path, dtype="float32")
 
     if cancel and cancel.is_set():
         raise CancelledError("Export cancelled")
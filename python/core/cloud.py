@@ -1,16 +1,23 @@
 """Cloud client — device-code auth + project CRUD for AudioSync cloud.
 
-Uses only stdlib (urllib) to avoid adding `requests` as a dependency.
+Uses only stdlib (http.client) to avoid adding `requests` as a dependency.
+Each thread keeps one keep-alive connection to the API, so repeated calls
+(e.g. device-token polling) skip the TCP and TLS handshakes.  Proxy
+settings are taken from the environment / system, as urllib does.
 All network calls raise descriptive exceptions on failure.
 """
 
 from __future__ import annotations
 
+import base64
+import http.client
 import json
 import logging
+import select
 import ssl
+import threading
 import time
-import urllib.error
+import urllib.parse
 import urllib.request
 from typing import Any, Optional
 
@@ -29,6 +36,40 @@ API_BASE = "https://api.keyhan.info"
 SETTINGS_ORG = "KeyhanStudio"
 SETTINGS_APP = "AudioSyncPro"
 
+_UNSET = object()
+
+# Methods that may be re-sent after the connection fails mid-request
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that offers a previous TLS session when connecting.
+
+    Resuming a session skips the full handshake when a dropped keep-alive
+    connection has to be re-established.
+    """
+
+    def __init__(self, *args, tls_session: Optional[ssl.SSLSession] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tls_session = tls_session
+
+    @property
+    def tls_session(self) -> Optional[ssl.SSLSession]:
+        """Session of the open socket, else the last one seen."""
+        return getattr(self.sock, "session", None) or self._tls_session
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=self._tls_session,
+        )
+
+    def close(self) -> None:
+        # The socket may be closed from inside getresponse(); keep its session
+        self._tls_session = self.tls_session
+        super().close()
+
 
 class CloudError(Exception):
     """Raised when a cloud API call fails."""
@@ -46,7 +87,17 @@ class CloudClient:
 
     def __init__(self, api_base: str = API_BASE) -> None:
         self._api_base = api_base.rstrip("/")
+        parts = urllib.parse.urlsplit(self._api_base)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._base_path = parts.path
         self._settings = QSettings(SETTINGS_ORG, SETTINGS_APP)
+        # In-memory copy of the stored token, read from QSettings on first use
+        self._token: Any = _UNSET
+        # Connections are not thread-safe; workers each get their own
+        self._local = threading.local()
+        # Last TLS session seen, offered for resumption on new connections
+        self._tls_session: Optional[ssl.SSLSession] = None
 
     # ----- Token management ---------------------------------------------------
 
@@ -54,16 +105,21 @@ class CloudClient:
         """Store JWT token persistently."""
         self._settings.setValue("cloud/token", token)
         self._settings.sync()
+        self._token = token or None
 
     def get_token(self) -> Optional[str]:
         """Retrieve stored JWT token."""
-        val = self._settings.value("cloud/token")
-        return val if val else None
+        if self._token is _UNSET:
+            val = self._settings.value("cloud/token")
+            self._token = val if val else None
+        return self._token
 
     def clear_token(self) -> None:
         """Remove stored token."""
+        # No explicit sync(): QSettings writes the change back from the
+        # event loop shortly afterwards, and again on destruction.
         self._settings.remove("cloud/token")
-        self._settings.sync()
+        self._token = None
 
     def is_authenticated(self) -> bool:
         """Check if we have a stored token."""
@@ -102,28 +158,39 @@ class CloudClient:
         Returns dict with token + user info on success.
         Raises CloudError on expiry or timeout.
         """
-        start = time.time()
-        while time.time() - start < timeout:
+        deadline = time.monotonic() + timeout
+        retry_delay = float(interval)
+        while time.monotonic() < deadline:
             try:
                 result = self._request("POST", "/auth/device/token", body={
                     "device_code": device_code,
                 })
-                if result.get("success") and result.get("token"):
-                    self.set_token(result["token"])
-                    return result
-                error = result.get("error", "")
-                if error == "expired":
-                    raise CloudError("Device code expired. Please try again.")
-                if error == "authorization_pending":
-                    time.sleep(interval)
-                    continue
-                # Unknown error
-                raise CloudError(f"Unexpected response: {error}")
-            except CloudError:
-                raise
-            except Exception as exc:
+            except CloudError as exc:
+                if exc.status_code:
+                    raise
+                # No answer from the server: back off, up to 30 seconds
                 logger.warning("Poll error: %s", exc)
+                time.sleep(max(0.0, min(retry_delay, deadline - time.monotonic())))
+                retry_delay = min(retry_delay * 2, 30.0)
+                continue
+            retry_delay = float(interval)
+
+            if result.get("success") and result.get("token"):
+                self.set_token(result["token"])
+                return result
+            error = result.get("error", "")
+            if error == "expired":
+                raise CloudError("Device code expired. Please try again.")
+            if error == "slow_down":
+                # RFC 8628: lengthen the polling interval by 5 seconds
+                interval += 5
                 time.sleep(interval)
+                continue
+            if error == "authorization_pending":
+                time.sleep(interval)
+                continue
+            # Unknown error
+            raise CloudError(f"Unexpected response: {error}")
 
         raise CloudError("Authentication timed out. Please try again.")
 
@@ -180,7 +247,6 @@ class CloudClient:
 
         Returns parsed JSON dict. Raises CloudError on failure.
         """
-        url = f"{self._api_base}{path}"
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -195,24 +261,19 @@ class CloudClient:
         if body is not None:
             data = json.dumps(body).encode("utf-8")
 
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
         try:
-            with urllib.request.urlopen(req, timeout=30, context=_ssl_ctx) as resp:
-                response_data = resp.read().decode("utf-8")
-                if not response_data:
-                    return {"success": True}
-                return json.loads(response_data)
-        except urllib.error.HTTPError as exc:
-            body_text = ""
-            try:
-                body_text = exc.read().decode("utf-8", errors="replace")
-            except Exception:
-                pass
+            status, payload = self._send(method, f"{self._base_path}{path}", data, headers)
+        except (OSError, http.client.HTTPException) as exc:
+            raise CloudError(f"Network error: {exc}")
+        except Exception as exc:
+            raise CloudError(f"Request failed: {exc}")
+
+        if status >= 400:
+            body_text = payload.decode("utf-8", errors="replace")
 
-            if exc.code == 401:
+            if status == 401:
                 raise CloudError("Authentication failed. Please sign in again.", 401)
-            if exc.code == 403:
+            if status == 403:
                 error_msg = "Access denied"
                 try:
                     error_data = json.loads(body_text)
@@ -220,19 +281,129 @@ class CloudClient:
                 except Exception:
                     pass
                 raise CloudError(error_msg, 403)
-            if exc.code == 404:
+            if status == 404:
                 raise CloudError("Resource not found.", 404)
 
             # Try to extract error message from response body
             try:
                 error_data = json.loads(body_text)
-                msg = error_data.get("error", f"HTTP {exc.code}")
+                msg = error_data.get("error", f"HTTP {status}")
             except Exception:
-                msg = f"HTTP {exc.code}: {body_text[:200]}"
+                msg = f"HTTP {status}: {body_text[:200]}"
 
-            raise CloudError(msg, exc.code)
+            raise CloudError(msg, status)
 
-        except urllib.error.URLError as exc:
-            raise CloudError(f"Network error: {exc.reason}")
+        try:
+            response_data = payload.decode("utf-8")
+            if not response_data:
+                return {"success": True}
+            return json.loads(response_data)
         except Exception as exc:
             raise CloudError(f"Request failed: {exc}")
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[bytes],
+        headers: dict,
+    ) -> tuple[int, bytes]:
+        """Send one request on this thread's connection; return (status, body).
+
+        A kept-alive connection the server has since closed is replaced
+        before sending.  If the connection fails mid-request, idempotent
+        requests are retried once on a fresh connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and _is_dropped(conn):
+            self._close_connection()
+            conn = None
+        reused = conn is not None
+        if conn is None:
+            conn, self._local.prefix, self._local.proxy_headers = self._open_connection()
+            self._local.conn = conn
+
+        if self._local.proxy_headers:
+            headers = {**headers, **self._local.proxy_headers}
+        target = self._local.prefix + path
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self._close_connection()
+            # The server may already have acted on the request
+            if not reused or method not in _IDEMPOTENT_METHODS:
+                raise
+            return self._send(method, path, data, headers)
+        except BaseException:
+            self._close_connection()
+            raise
+
+        # TLS 1.3 tickets arrive after the handshake, so pick the session
+        # up once a response has been read
+        session = getattr(conn, "tls_session", None)
+        if session is not None:
+            self._tls_session = session
+        if resp.will_close:
+            self._close_connection()
+        return resp.status, payload
+
+    def _open_connection(self) -> tuple[http.client.HTTPConnection, str, dict]:
+        """Connect to the API, through the system proxy when one applies.
+
+        Returns (connection, request path prefix, extra headers).  HTTPS is
+        tunnelled through a proxy with CONNECT; plain HTTP is sent to the
+        proxy with absolute URLs, as urllib does.
+        """
+        host = urllib.parse.urlsplit(f"//{self._netloc}").hostname or self._netloc
+        proxy = None
+        if not urllib.request.proxy_bypass(host):
+            proxy = urllib.request.getproxies().get(self._scheme)
+
+        proxy_headers = {}
+        if proxy:
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            proxy_parts = urllib.parse.urlsplit(proxy)
+            address = proxy_parts.netloc.rpartition("@")[2]
+            if proxy_parts.username is not None:
+                creds = "%s:%s" % (
+                    urllib.parse.unquote(proxy_parts.username),
+                    urllib.parse.unquote(proxy_parts.password or ""),
+                )
+                proxy_headers["Proxy-Authorization"] = (
+                    "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+                )
+        else:
+            address = self._netloc
+
+        if self._scheme == "http":
+            conn = http.client.HTTPConnection(address, timeout=30)
+            if proxy:
+                return conn, f"http://{self._netloc}", proxy_headers
+            return conn, "", {}
+
+        conn = _ResumingHTTPSConnection(
+            address, timeout=30, context=_ssl_ctx, tls_session=self._tls_session,
+        )
+        if proxy:
+            conn.set_tunnel(self._netloc, headers=proxy_headers)
+        return conn, "", {}
+
+    def _close_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """Whether the server has closed (or written to) an idle connection."""
+    if conn.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
@@ -25,12 +25,17 @@ Performance notes
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from threading import Event
-from typing import Optional
+from typing import Iterator, Optional
 
 import numpy as np
-from scipy.signal import fftconvolve, resample
+from scipy import fft as sp_fft
+from scipy.signal import resample
 
 from .models import (
     ANALYSIS_SR,
@@ -46,6 +51,15 @@ logger = logging.getLogger("audiosync.engine")
 # Confidence threshold — clips below this are considered poorly matched
 CONFIDENCE_THRESHOLD = 3.0
 
+# Worker threads for a single scipy.fft transform (-1 = all cores)
+_FFT_WORKERS = -1
+
+# Working-memory cap for one stacked transform in compute_delays_batch
+_BATCH_MAX_BYTES = 256 * 1024 * 1024
+
+# Shortest reference worth moving to the GPU (SyncConfig.use_gpu)
+_GPU_MIN_SAMPLES = 1 << 20
+
 
 # ---------------------------------------------------------------------------
 #  Public API
@@ -78,6 +92,13 @@ def analyze(
     if total_clips == 0:
         raise ValueError("No clips loaded in any track.")
 
+    for track in tracks:
+        for clip in track.clips:
+            if clip.samples is None:
+                raise ValueError(
+                    f"Analysis samples for '{clip.name}' were released — reload the clip."
+                )
+
     def _check():
         if cancel and cancel.is_set():
             raise CancelledError("Analysis cancelled")
@@ -139,35 +160,65 @@ def analyze(
         clip_offsets[clip.file_path] = clip.timeline_offset_samples
         confidences.append(clip.confidence)
 
-    # Correlate all non-reference clips
-    for track in tracks:
-        if track is ref_track:
-            continue
-        for clip in track.clips:
-            step += 1
-            _progress(step, total_steps, f"Pass 1: correlating '{clip.name}'...")
-            _check()
+    # Transform the reference once; each clip then costs one forward and
+    # one inverse FFT of its own.
+    max_clip_len = max(
+        (c.length_samples for t in tracks if t is not ref_track for c in t.clips),
+        default=1,
+    )
+    ref_prepared = prepare_reference(
+        ref_audio, max_clip_len, use_gpu=config.use_gpu,
+    )
 
-            delay, conf = compute_delay(
-                ref_audio, clip.samples, sr, config.max_offset_s
-            )
+    # Correlate all non-reference clips.  The FFT work runs in NumPy/SciPy
+    # and releases the GIL, so clips are correlated in parallel; results
+    # are consumed in submission order to keep the output deterministic.
+    # Each in-flight clip holds its own nfft-sized buffers, so bound the
+    # pool by the same working-memory cap as compute_delays_batch; GPU
+    # transforms share one device and run one at a time.
+    jobs = [c for t in tracks if t is not ref_track for c in t.clips]
+    if isinstance(ref_prepared[0], np.ndarray):
+        memory_workers = _BATCH_MAX_BYTES // _correlation_bytes(ref_prepared[2])
+    else:
+        memory_workers = 1
+    workers = max(1, min(os.cpu_count() or 1, len(jobs), memory_workers))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            # One clip per thread, so each transform stays single-threaded
+            pool.submit(compute_delay_prepared,
+                        ref_prepared, clip.samples, sr, config.max_offset_s,
+                        workers=1)
+            for clip in jobs
+        ]
+        try:
+            for clip, future in zip(jobs, futures):
+                _check()
+                delay, conf = future.result()
 
-            clip.timeline_offset_samples = delay
-            clip.timeline_offset_s = delay / sr
-            clip.confidence = conf
-            clip.analyzed = True
+                step += 1
+                _progress(step, total_steps, f"Pass 1: correlated '{clip.name}'")
 
-            clip_offsets[clip.file_path] = delay
-            confidences.append(conf)
+                clip.timeline_offset_samples = delay
+                clip.timeline_offset_s = delay / sr
+                clip.confidence = conf
+                clip.analyzed = True
 
-            if conf >= CONFIDENCE_THRESHOLD:
-                placed_clips.append(clip)
-            else:
-                unplaced_clips.append(clip)
-                msg = f"Low confidence ({conf:.1f}) for '{clip.name}'"
-                warnings.append(msg)
-                logger.warning(msg)
+                clip_offsets[clip.file_path] = delay
+                confidences.append(conf)
 
+                if conf >= CONFIDENCE_THRESHOLD:
+                    placed_clips.append(clip)
+                else:
+                    unplaced_clips.append(clip)
+                    msg = f"Low confidence ({conf:.1f}) for '{clip.name}'"
+                    warnings.append(msg)
+                    logger.warning(msg)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    del ref_prepared
     _check()
 
     # ------------------------------------------------------------------
@@ -177,18 +228,24 @@ def analyze(
         _progress(step + 1, total_steps, "Pass 2: building enhanced timeline...")
         _check()
 
-        # Build enhanced timeline: reference + all high-confidence placed clips
-        enhanced = _stitch_enhanced_timeline(ref_audio, placed_clips, sr)
-
-        for clip in unplaced_clips:
+        # Build enhanced timeline: reference + all high-confidence placed
+        # clips.  ref_audio is not needed after this, so overlay onto it.
+        enhanced = _stitch_enhanced_timeline(ref_audio, placed_clips, sr, in_place=True)
+        enhanced_prepared = prepare_reference(
+            enhanced, max(c.length_samples for c in unplaced_clips),
+            use_gpu=config.use_gpu,
+        )
+
+        # Pass 2 runs serially, so batch the clips into stacked transforms
+        results = compute_delays_batch(
+            enhanced_prepared, [c.samples for c in unplaced_clips], sr,
+            config.max_offset_s, cancel=cancel,
+        )
+        for clip, (delay, conf) in zip(unplaced_clips, results):
             step += 1
             _progress(step, total_steps, f"Pass 2: retrying '{clip.name}'...")
             _check()
 
-            delay, conf = compute_delay(
-                enhanced, clip.samples, sr, config.max_offset_s
-            )
-
             if conf > clip.confidence:
                 clip.timeline_offset_samples = delay
                 clip.timeline_offset_s = delay / sr
@@ -202,7 +259,10 @@ def analyze(
                     warnings = [w for w in warnings if clip.name not in w]
 
         # Free enhanced timeline memory
-        del enhanced
+        del results, enhanced, enhanced_prepared
+
+    # The reference timeline is rebuilt after normalization (Phase 8)
+    del ref_audio
 
     _check()
 
@@ -229,20 +289,25 @@ def analyze(
     _progress(total_steps - 1, total_steps, "Normalizing timeline...")
     _check()
 
-    min_offset = 0
-    max_end = 0
-    for track in tracks:
-        for clip in track.clips:
-            min_offset = min(min_offset, clip.timeline_offset_samples)
-            max_end = max(max_end, clip.end_samples)
+    # Aggregate in NumPy; only the per-clip write-back stays in Python.
+    all_clips = [clip for track in tracks for clip in track.clips]
+    offsets = np.fromiter(
+        (c.timeline_offset_samples for c in all_clips),
+        dtype=np.int64, count=len(all_clips),
+    )
+    lengths = np.fromiter(
+        (c.length_samples for c in all_clips),
+        dtype=np.int64, count=len(all_clips),
+    )
+    min_offset = min(0, int(offsets.min()))
+    max_end = max(0, int((offsets + lengths).max()))
 
     if min_offset < 0:
         shift = -min_offset
-        for track in tracks:
-            for clip in track.clips:
-                clip.timeline_offset_samples += shift
-                clip.timeline_offset_s = clip.timeline_offset_samples / sr
-                clip_offsets[clip.file_path] = clip.timeline_offset_samples
+        for clip in all_clips:
+            clip.timeline_offset_samples += shift
+            clip.timeline_offset_s = clip.timeline_offset_samples / sr
+            clip_offsets[clip.file_path] = clip.timeline_offset_samples
         max_end += shift
 
     avg_conf = float(np.mean(confidences)) if confidences else 0.0
@@ -256,26 +321,35 @@ def analyze(
     # Rebuild reference timeline after normalization for drift measurement
     ref_audio_normalized = _build_reference_from_metadata(ref_track, sr)
 
+    # Clips are measured in parallel, like Pass 1
     drift_detected = False
-    for track in tracks:
-        if track is ref_track:
-            continue
-        for clip in track.clips:
-            if not clip.analyzed:
-                continue
-            if clip.duration_s < _MIN_DRIFT_OVERLAP_S:
-                continue
-
-            drift_ppm, r_sq = measure_drift(ref_audio_normalized, clip, sr)
-
-            if r_sq > 0.5 and abs(drift_ppm) > config.drift_threshold_ppm:
-                clip.drift_ppm = drift_ppm
-                clip.drift_confidence = r_sq
-                drift_detected = True
-                logger.info(
-                    "Drift detected for '%s': %.2f ppm (R²=%.3f)",
-                    clip.name, drift_ppm, r_sq,
-                )
+    drift_jobs = [
+        c for t in tracks if t is not ref_track for c in t.clips
+        if c.analyzed and c.duration_s >= _MIN_DRIFT_OVERLAP_S
+    ]
+    workers = max(1, min(os.cpu_count() or 1, len(drift_jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(measure_drift, ref_audio_normalized, clip, sr, workers=1)
+            for clip in drift_jobs
+        ]
+        try:
+            for clip, future in zip(drift_jobs, futures):
+                _check()
+                drift_ppm, r_sq = future.result()
+
+                if r_sq > 0.5 and abs(drift_ppm) > config.drift_threshold_ppm:
+                    clip.drift_ppm = drift_ppm
+                    clip.drift_confidence = r_sq
+                    drift_detected = True
+                    logger.info(
+                        "Drift detected for '%s': %.2f ppm (R²=%.3f)",
+                        clip.name, drift_ppm, r_sq,
+                    )
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
     # Inherit drift for short clips on the same track
     if drift_detected:
@@ -283,6 +357,13 @@ def analyze(
 
     del ref_audio_normalized
 
+    # The 8 kHz copies are only needed for analysis; sync() re-reads the
+    # original files at full resolution.
+    if config.release_samples:
+        for track in tracks:
+            for clip in track.clips:
+                clip.release_samples()
+
     result = SyncResult(
         reference_track_index=ref_idx,
         total_timeline_samples=max_end,
@@ -340,15 +421,15 @@ def sync(
         _check()
 
         if not track.clips:
-            track.synced_audio = np.zeros(total_len, dtype=np.float64)
+            track.synced_audio = np.zeros(total_len, dtype=np.float32)
             continue
 
         # Determine output channels
         max_ch = max(c.original_channels for c in track.clips)
         if max_ch == 1:
-            output = np.zeros(total_len, dtype=np.float64)
+            output = np.zeros(total_len, dtype=np.float32)
         else:
-            output = np.zeros((total_len, max_ch), dtype=np.float64)
+            output = np.zeros((total_len, max_ch), dtype=np.float32)
 
         for clip in track.clips:
             step += 1
@@ -384,7 +465,7 @@ def sync(
                 if audio.ndim == 1:
                     a = np.column_stack([audio] * max_ch)
                 elif audio.shape[1] < max_ch:
-                    pad = np.zeros((audio.shape[0], max_ch - audio.shape[1]), dtype=np.float64)
+                    pad = np.zeros((audio.shape[0], max_ch - audio.shape[1]), dtype=np.float32)
                     a = np.column_stack([audio, pad])
                 else:
                     a = audio[:, :max_ch]
@@ -396,13 +477,7 @@ def sync(
             if start >= total_len:
                 continue
 
-            segment = output[start:end]
-            if max_ch == 1:
-                has_audio = np.abs(segment) > 1e-10
-                output[start:end] = np.where(has_audio, (segment + a) / 2.0, a)
-            else:
-                has_audio = np.any(np.abs(segment) > 1e-10, axis=1, keepdims=True)
-                output[start:end] = np.where(has_audio, (segment + a) / 2.0, a)
+            _mix_into(output[start:end], a)
 
             # Free memory immediately
             del audio, a
@@ -430,43 +505,256 @@ def compute_delay(
     FFT cross-correlation to find the delay of *target* relative to
     *reference*.  At 8 kHz this is extremely fast and memory-efficient.
     """
-    ref = reference.astype(np.float32)
-    tgt = target.astype(np.float32)
+    prepared = prepare_reference(reference, len(target))
+    return compute_delay_prepared(prepared, target, sr, max_offset_s)
+
+
+def prepare_reference(
+    reference: np.ndarray,
+    max_target_len: int,
+    workers: int = _FFT_WORKERS,
+    use_gpu: bool = False,
+) -> tuple[np.ndarray, int, int]:
+    """
+    Normalize *reference* and take its real FFT once so it can be
+    correlated against many targets.
+
+    The FFT size covers a full linear correlation with any target of up
+    to *max_target_len* samples.
+
+    With *use_gpu*, a long reference is transformed with CuPy and its
+    spectrum stays on the GPU, so each target only uploads itself.  Falls
+    back to the CPU when CuPy or a CUDA device is unavailable.
+
+    Returns
+    -------
+    (ref_fft, ref_len, nfft) — pass to :func:`compute_delay_prepared`.
+    """
+    ref = np.ascontiguousarray(reference, dtype=np.float32)
 
     # Normalize
     ref_max = np.max(np.abs(ref))
-    tgt_max = np.max(np.abs(tgt))
     if ref_max > 1e-10:
         ref = ref / ref_max
+
+    ref_len = len(ref)
+    nfft = _fft_size(ref_len + max(max_target_len, 1) - 1)
+    cp = _cupy() if use_gpu and ref_len >= _GPU_MIN_SAMPLES else None
+    if cp is not None:
+        ref_fft = cp.fft.rfft(cp.asarray(ref), n=nfft)
+    else:
+        ref_fft = sp_fft.rfft(ref, n=nfft, workers=workers)
+    return ref_fft, ref_len, nfft
+
+
+_cupy_module = None
+_cupy_checked = False
+
+
+def _cupy():
+    """CuPy, if it is installed and a CUDA device is present; else None."""
+    global _cupy_module, _cupy_checked
+    if not _cupy_checked:
+        _cupy_checked = True
+        try:
+            import cupy
+            if cupy.cuda.runtime.getDeviceCount() > 0:
+                _cupy_module = cupy
+        except Exception as e:
+            logger.info("GPU correlation unavailable: %s", e)
+    return _cupy_module
+
+
+def compute_delay_prepared(
+    prepared: tuple[np.ndarray, int, int],
+    target: np.ndarray,
+    sr: int,
+    max_offset_s: Optional[float] = None,
+    workers: int = _FFT_WORKERS,
+) -> tuple[int, float]:
+    """
+    Same as :func:`compute_delay`, against a reference already
+    transformed by :func:`prepare_reference`.
+
+    *workers* is passed to scipy.fft; use 1 when calls already run in
+    parallel.
+    """
+    ref_fft, ref_len, nfft = prepared
+    if len(target) + ref_len - 1 > nfft:
+        raise ValueError("Target is longer than the prepared reference allows.")
+
+    tgt = np.ascontiguousarray(target, dtype=np.float32)
+
+    # Normalize
+    tgt_max = np.max(np.abs(tgt))
     if tgt_max > 1e-10:
         tgt = tgt / tgt_max
 
-    # FFT cross-correlation
-    correlation = fftconvolve(ref, tgt[::-1], mode="full")
+    # Circular FFT cross-correlation: index k holds lag k, negative lags
+    # wrap to the end.  Multiplying by the conjugate spectrum avoids
+    # reversing the target, and the shared FFT size keeps scipy.fft's
+    # plan cache warm across clips.
+    if not isinstance(ref_fft, np.ndarray):
+        correlation = _gpu_correlate(ref_fft, tgt, nfft)
+    else:
+        tgt_fft = sp_fft.rfft(tgt, n=nfft, workers=workers)
+        np.conjugate(tgt_fft, out=tgt_fft)
+        tgt_fft *= ref_fft
+        correlation = sp_fft.irfft(tgt_fft, n=nfft, workers=workers)
+        del tgt_fft
+
+    return _delay_from_correlation(correlation, ref_len, len(tgt), sr, max_offset_s)
+
+
+def compute_delays_batch(
+    prepared: tuple[np.ndarray, int, int],
+    targets: list[np.ndarray],
+    sr: int,
+    max_offset_s: Optional[float] = None,
+    workers: int = _FFT_WORKERS,
+    max_batch_bytes: int = _BATCH_MAX_BYTES,
+    cancel: Optional[Event] = None,
+) -> Iterator[tuple[int, float]]:
+    """
+    Correlate several targets against one prepared reference, yielding
+    (delay_samples, confidence) for each target in order.
+
+    Targets are zero-padded into a 2-D stack and transformed together
+    along the last axis, as many per batch as fit in *max_batch_bytes*
+    of working memory.  Batches are computed lazily, so the caller can
+    stop between results; *cancel* is also checked between the targets
+    of a batch and raises CancelledError once set.
+    """
+    ref_fft, ref_len, nfft = prepared
+    if any(len(t) + ref_len - 1 > nfft for t in targets):
+        raise ValueError("Target is longer than the prepared reference allows.")
+
+    batch_size = max(1, max_batch_bytes // _correlation_bytes(nfft))
+
+    for first in range(0, len(targets), batch_size):
+        batch = targets[first:first + batch_size]
+        stack = np.zeros((len(batch), nfft), dtype=np.float32)
+        for row, target in zip(stack, batch):
+            tgt_max = np.max(np.abs(target)) if len(target) else 0.0
+            row[:len(target)] = target
+            if tgt_max > 1e-10:
+                row[:len(target)] /= tgt_max
+
+        if not isinstance(ref_fft, np.ndarray):
+            _check_cancel(cancel)
+            correlations = _gpu_correlate(ref_fft, stack, nfft)
+        else:
+            # Transform row by row so a cancel is seen between targets
+            correlations = np.empty((len(batch), nfft), dtype=np.float32)
+            for row, correlation in zip(stack, correlations):
+                _check_cancel(cancel)
+                spectrum = sp_fft.rfft(row, workers=workers)
+                np.conjugate(spectrum, out=spectrum)
+                spectrum *= ref_fft
+                correlation[:] = sp_fft.irfft(spectrum, n=nfft, workers=workers)
+                del spectrum
+        del stack
+
+        for correlation, target in zip(correlations, batch):
+            yield _delay_from_correlation(
+                correlation, ref_len, len(target), sr, max_offset_s,
+            )
+        del correlations
+
+
+def _check_cancel(cancel: Optional[Event]) -> None:
+    if cancel is not None and cancel.is_set():
+        raise CancelledError("Analysis cancelled")
 
+
+def _correlation_bytes(nfft: int) -> int:
+    """Working memory for correlating one target: samples, spectrum, result."""
+    return nfft * 4 + (nfft // 2 + 1) * 8 + nfft * 4
+
+
+def _gpu_correlate(ref_fft, targets: np.ndarray, nfft: int) -> np.ndarray:
+    """
+    Circular cross-correlation of *targets* (one row per target) against
+    a reference spectrum resident on the GPU; the result is copied back.
+    """
+    cp = _cupy()
+    spectra = cp.fft.rfft(cp.asarray(targets), n=nfft, axis=-1)
+    cp.conjugate(spectra, out=spectra)
+    spectra *= ref_fft
+    return cp.asnumpy(cp.fft.irfft(spectra, n=nfft, axis=-1))
+
+
+def _delay_from_correlation(
+    correlation: np.ndarray,
+    ref_len: int,
+    tgt_len: int,
+    sr: int,
+    max_offset_s: Optional[float],
+) -> tuple[int, float]:
+    """
+    Peak lag and confidence of one circular cross-correlation.
+    *correlation* is overwritten.
+    """
+    nfft = len(correlation)
+
+    # Valid lags: the target may start up to tgt_len-1 samples before the
+    # reference and anywhere up to its last sample.
+    min_lag = -(tgt_len - 1)
+    max_lag = ref_len - 1
     if max_offset_s is not None:
         max_samples = int(max_offset_s * sr)
-        center = len(tgt) - 1
-        lo = max(0, center - max_samples)
-        hi = min(len(correlation), center + max_samples + 1)
-        search_region = correlation[lo:hi]
-        peak_idx_local = int(np.argmax(np.abs(search_region)))
-        peak_idx = peak_idx_local + lo
-    else:
-        peak_idx = int(np.argmax(np.abs(correlation)))
-
-    delay_samples = peak_idx - (len(tgt) - 1)
+        min_lag = max(min_lag, -max_samples)
+        max_lag = min(max_lag, max_samples)
 
-    abs_corr = np.abs(correlation)
-    mean_corr = float(np.mean(abs_corr))
-    confidence = float(abs_corr[peak_idx] / (mean_corr + 1e-10))
+    np.abs(correlation, out=correlation)
+    delay_samples = _peak_lag(correlation, min_lag, max_lag)
 
-    # Free correlation array immediately
-    del correlation, abs_corr
+    # Noise floor: mean |correlation| over every linear lag, searched or not
+    n_lags = ref_len + tgt_len - 1
+    abs_sum = (
+        float(np.sum(correlation[:ref_len]))
+        + float(np.sum(correlation[nfft - tgt_len + 1:]))
+    )
+    mean_corr = abs_sum / n_lags
+    confidence = float(correlation[delay_samples % nfft] / (mean_corr + 1e-10))
 
     return delay_samples, confidence
 
 
+def _lag_views(
+    corr: np.ndarray, min_lag: int, max_lag: int,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Split lags [*min_lag*, *max_lag*] of a circular correlation (lag k
+    stored at index k mod len) into views of the negative and
+    non-negative lags.  Returns (neg, pos, first lag of pos).
+    """
+    n = len(corr)
+    neg = corr[n + min_lag:n + min(max_lag, -1) + 1] if min_lag < 0 else corr[:0]
+    pos_start = max(min_lag, 0)
+    pos = corr[pos_start:max_lag + 1] if max_lag >= 0 else corr[:0]
+    return neg, pos, pos_start
+
+
+def _peak_lag(abs_corr: np.ndarray, min_lag: int, max_lag: int) -> int:
+    """
+    Lag in [*min_lag*, *max_lag*] with the largest value in a circular
+    correlation.  Ties resolve to the most negative lag, as an argmax
+    over the linear layout would.
+    """
+    neg, pos, pos_start = _lag_views(abs_corr, min_lag, max_lag)
+    best_lag: Optional[int] = None
+    best_val = 0.0
+    if len(neg):
+        i = int(np.argmax(neg))
+        best_lag, best_val = min_lag + i, neg[i]
+    if len(pos):
+        i = int(np.argmax(pos))
+        if best_lag is None or pos[i] > best_val:
+            best_lag = pos_start + i
+    return best_lag
+
+
 # ---------------------------------------------------------------------------
 #  Clock drift detection
 # ---------------------------------------------------------------------------
@@ -505,13 +793,14 @@ def _subsample_peak(correlation: np.ndarray, peak_idx: int) -> float:
 def _windowed_offset(
     ref_segment: np.ndarray,
     clip_segment: np.ndarray,
+    workers: int = _FFT_WORKERS,
 ) -> float:
     """
     Cross-correlate two equal-length windows and return the sub-sample
     offset of *clip_segment* relative to *ref_segment*.
     """
-    ref = ref_segment.astype(np.float32)
-    tgt = clip_segment.astype(np.float32)
+    ref = np.ascontiguousarray(ref_segment, dtype=np.float32)
+    tgt = np.ascontiguousarray(clip_segment, dtype=np.float32)
 
     ref_max = np.max(np.abs(ref))
     tgt_max = np.max(np.abs(tgt))
@@ -520,30 +809,61 @@ def _windowed_offset(
     if tgt_max > 1e-10:
         tgt = tgt / tgt_max
 
-    corr = fftconvolve(ref, tgt[::-1], mode="full")
+    corr = _circular_correlation(ref, tgt, workers)
     abs_corr = np.abs(corr)
-    peak_idx = int(np.argmax(abs_corr))
+    min_lag = -(len(tgt) - 1)
+    max_lag = len(ref) - 1
+    lag = _peak_lag(abs_corr, min_lag, max_lag)
 
-    # Refine to sub-sample precision
-    refined = _subsample_peak(abs_corr, peak_idx)
-    offset = refined - (len(tgt) - 1)
+    # Refine to sub-sample precision (not at the edges of the lag range)
+    offset = float(lag)
+    if min_lag < lag < max_lag:
+        n = len(abs_corr)
+        around = abs_corr[np.arange(lag - 1, lag + 2) % n]
+        offset += _subsample_peak(around, 1) - 1.0
 
     del corr, abs_corr
     return offset
 
 
+@functools.lru_cache(maxsize=256)
+def _fft_size(n: int) -> int:
+    """Smallest size >= *n* that pocketfft transforms fast for real input."""
+    return sp_fft.next_fast_len(n, real=True)
+
+
+def _circular_correlation(
+    ref: np.ndarray,
+    tgt: np.ndarray,
+    workers: int = _FFT_WORKERS,
+) -> np.ndarray:
+    """
+    Cross-correlation of *tgt* against *ref* via rfft, zero-padded so it
+    does not alias.  Lag k is stored at index k mod len (negative lags
+    wrap to the end); read it with :func:`_peak_lag`.
+    """
+    nfft = _fft_size(len(ref) + len(tgt) - 1)
+    spectrum = sp_fft.rfft(tgt, n=nfft, workers=workers)
+    np.conjugate(spectrum, out=spectrum)
+    spectrum *= sp_fft.rfft(ref, n=nfft, workers=workers)
+    return sp_fft.irfft(spectrum, n=nfft, workers=workers)
+
+
 def measure_drift(
     ref_timeline: np.ndarray,
     clip: "Clip",
     sr: int = ANALYSIS_SR,
     window_s: float = 30.0,
     stride_s: float = 15.0,
+    workers: int = _FFT_WORKERS,
 ) -> tuple[float, float]:
     """
     Measure clock drift of *clip* relative to the reference timeline.
 
     Slides a window along the overlapping region, cross-correlates each
     window, and fits a linear regression to the measured offsets.
+    *workers* is passed to scipy.fft for each window.  Neither
+    *ref_timeline* nor the clip's samples are modified.
 
     Returns
     -------
@@ -590,7 +910,7 @@ def measure_drift(
             pos += stride_samples
             continue
 
-        offset = _windowed_offset(ref_win, clip_win)
+        offset = _windowed_offset(ref_win, clip_win, workers)
         time_s = (pos - overlap_start) / sr
         times.append(time_s)
         offsets.append(offset)
@@ -727,18 +1047,30 @@ def _get_coverage_span(track: Track) -> float:
     Calculate the time span covered by a track's clips using metadata.
     Returns 0 if no metadata available.
     """
-    times = [(c.creation_time, c.duration_s) for c in track.clips if c.creation_time]
-    if not times:
+    earliest_start = math.inf
+    latest_end = -math.inf
+    for c in track.clips:
+        ct = c.creation_time
+        if not ct:
+            continue
+        if ct < earliest_start:
+            earliest_start = ct
+        end = ct + c.duration_s
+        if end > latest_end:
+            latest_end = end
+    if earliest_start == math.inf:
         return 0.0
-    earliest_start = min(t[0] for t in times)
-    latest_end = max(t[0] + t[1] for t in times)
     return latest_end - earliest_start
 
 
 def _get_track_time_origin(track: Track) -> Optional[float]:
     """Get the earliest creation_time in a track (the timeline origin)."""
-    times = [c.creation_time for c in track.clips if c.creation_time]
-    return min(times) if times else None
+    origin = None
+    for c in track.clips:
+        ct = c.creation_time
+        if ct and (origin is None or ct < origin):
+            origin = ct
+    return origin
 
 
 def _build_reference_from_metadata(track: Track, sr: int) -> np.ndarray:
@@ -754,47 +1086,40 @@ def _build_reference_from_metadata(track: Track, sr: int) -> np.ndarray:
     if not clips:
         raise ValueError(f"Reference track '{track.name}' has no clips.")
 
-    # Single clip: trivial case
-    if len(clips) == 1:
-        clips[0].timeline_offset_samples = 0
-        clips[0].timeline_offset_s = 0.0
-        clips[0].confidence = 100.0
-        clips[0].analyzed = True
-        return clips[0].samples.copy()
-
-    # Place clips using metadata gaps
-    clips[0].timeline_offset_samples = 0
-    clips[0].timeline_offset_s = 0.0
-    clips[0].confidence = 100.0
-    clips[0].analyzed = True
-
-    for i in range(1, len(clips)):
-        prev = clips[i - 1]
-        curr = clips[i]
-
-        if prev.creation_time and curr.creation_time:
-            # Gap = next clip start - (previous clip start + previous clip duration)
-            gap_s = curr.creation_time - (prev.creation_time + prev.duration_s)
-            gap_s = max(gap_s, 0.0)  # no negative gaps (clock drift safety)
-        else:
-            # No metadata: assume small gap between sequential files
-            gap_s = 0.5
-
-        offset_samples = prev.timeline_offset_samples + prev.length_samples + int(gap_s * sr)
+    # Place clips using metadata gaps.  Offsets are a cumulative sum of
+    # clip lengths plus gaps, computed over per-clip arrays.
+    n = len(clips)
+    creation = np.fromiter((c.creation_time or np.nan for c in clips), np.float64, n)
+    durations = np.fromiter((c.duration_s for c in clips), np.float64, n)
+    lengths = np.fromiter((c.length_samples for c in clips), np.int64, n)
+
+    # Gap = next clip start - (previous clip start + previous clip duration),
+    # never negative (clock drift safety).  Without metadata on both sides,
+    # assume a small gap between sequential files.
+    gap_s = np.maximum(creation[1:] - (creation[:-1] + durations[:-1]), 0.0)
+    gap_s[np.isnan(gap_s)] = 0.5
+    gap_samples = (gap_s * sr).astype(np.int64)
+
+    offsets = np.zeros(n, dtype=np.int64)
+    np.cumsum(lengths[:-1] + gap_samples, out=offsets[1:])
+    max_end = int(np.max(offsets + lengths))
+
+    for curr, offset_samples in zip(clips, offsets.tolist()):
         curr.timeline_offset_samples = offset_samples
         curr.timeline_offset_s = offset_samples / sr
         curr.confidence = 100.0
         curr.analyzed = True
 
-    # Stitch all clips into a single array with silence in gaps
-    max_end = max(c.end_samples for c in clips)
+    # Single clip: the timeline is just a copy of its samples
+    if len(clips) == 1:
+        return clips[0].samples.astype(np.float32)
+
+    # Stitch all clips into one preallocated array with silence in gaps
+    # (max_end already covers every placed clip, so none are clipped)
     ref_audio = np.zeros(max_end, dtype=np.float32)
 
-    for c in clips:
-        start = c.timeline_offset_samples
-        end = start + len(c.samples)
-        seg_len = min(end, max_end) - start
-        ref_audio[start:start + seg_len] = c.samples[:seg_len]
+    for c, start, seg_len in zip(clips, offsets.tolist(), lengths.tolist()):
+        np.copyto(ref_audio[start:start + seg_len], c.samples[:seg_len])
 
     return ref_audio
 
@@ -803,6 +1128,7 @@ def _stitch_enhanced_timeline(
     ref_audio: np.ndarray,
     placed_clips: list[Clip],
     sr: int,
+    in_place: bool = False,
 ) -> np.ndarray:
     """
     Build an enhanced timeline by overlaying high-confidence clips
@@ -811,34 +1137,95 @@ def _stitch_enhanced_timeline(
     This gives Pass 2 more audio to correlate against — useful when
     a clip only overlaps with a non-reference device that was placed
     in Pass 1.
+
+    With *in_place*, clips are mixed directly into *ref_audio* when they
+    all fit inside it, instead of into a fresh copy; *ref_audio* then
+    holds the enhanced timeline and must not be used as the plain
+    reference afterwards.  Otherwise only the part past its end is
+    zeroed, so the reference is written once.
     """
     if not placed_clips:
         return ref_audio
 
-    # Find the maximum extent
-    max_end = len(ref_audio)
-    for clip in placed_clips:
-        max_end = max(max_end, clip.end_samples)
+    # Find the maximum extent and each clip's span within it.  Each placed
+    # clip is visited once here and once when layering, so stitching is
+    # linear in the overlapped audio.
+    n = len(placed_clips)
+    starts = np.fromiter((c.timeline_offset_samples for c in placed_clips), np.int64, n)
+    lengths = np.fromiter((len(c.samples) for c in placed_clips), np.int64, n)
+    ref_len = len(ref_audio)
+    max_end = max(ref_len, int(np.max(starts + lengths)))
+    seg_lens = np.minimum(starts + lengths, max_end) - starts
+
+    if in_place and max_end == ref_len:
+        enhanced = ref_audio
+    else:
+        # Start with a copy of the reference, silence past its end
+        enhanced = np.empty(max_end, dtype=np.float32)
+        np.copyto(enhanced[:ref_len], ref_audio)
+        enhanced[ref_len:] = 0.0
+
+    # Layer in placed clips.  Past covered_end the timeline is still
+    # silent, so that part of a clip is copied without mixing.
+    covered_end = ref_len
+    for clip, start, seg_len in zip(placed_clips, starts.tolist(), seg_lens.tolist()):
+        if start < 0 or seg_len <= 0:
+            continue
 
-    # Start with a copy of the reference
-    enhanced = np.zeros(max_end, dtype=np.float32)
-    enhanced[:len(ref_audio)] = ref_audio
+        end = start + seg_len
+        mix_len = min(max(covered_end - start, 0), seg_len)
+        if mix_len:
+            _mix_into(enhanced[start:start + mix_len], clip.samples[:mix_len])
+        if mix_len < seg_len:
+            np.copyto(enhanced[start + mix_len:end], clip.samples[mix_len:seg_len])
+        covered_end = max(covered_end, end)
 
-    # Layer in placed clips
-    for clip in placed_clips:
-        start = clip.timeline_offset_samples
-        if start < 0:
-            continue
-        end = start + len(clip.samples)
-        seg_len = min(end, max_end) - start
-        if seg_len <= 0:
-            continue
+    return enhanced
 
-        segment = enhanced[start:start + seg_len]
-        clip_data = clip.samples[:seg_len]
 
-        # Mix: where silence exists, use clip data; where audio exists, average
-        mask = np.abs(segment) < 1e-10
-        enhanced[start:start + seg_len] = np.where(mask, clip_data, (segment + clip_data) / 2)
+# Samples per block when mixing, so the temporaries stay cache-resident
+_MIX_BLOCK = 1 << 16
 
-    return enhanced
+# Bit pattern of the silence threshold; for float32 with the sign bit
+# cleared, integer order matches magnitude order
+_SILENCE_BITS = np.float32(1e-10).view(np.uint32)
+
+
+def _silent(samples: np.ndarray, scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Mask of silent samples (magnitude at most 1e-10).  For multi-channel
+    audio, one entry per frame, true only if every channel is silent.
+
+    float32 audio is tested on its bits — the sign bit masked off gives
+    the magnitude — so no float temporary is built; *scratch* (uint32, the
+    shape of *samples*) holds the masked bits if given.
+    """
+    if samples.dtype != np.float32:
+        if samples.ndim == 1:
+            return np.abs(samples) <= 1e-10
+        return ~np.any(np.abs(samples) > 1e-10, axis=1, keepdims=True)
+
+    bits = np.bitwise_and(samples.view(np.uint32), 0x7FFFFFFF, out=scratch)
+    if samples.ndim > 1:
+        bits = np.max(bits, axis=1, keepdims=True)
+    return bits <= _SILENCE_BITS
+
+
+def _mix_into(segment: np.ndarray, data: np.ndarray) -> None:
+    """
+    Mix *data* into *segment* in place: where *segment* already holds
+    audio the two are averaged, where it is silent *data* is copied.
+    A multi-channel frame counts as silent only if every channel is.
+
+    Works block by block so the silence mask and the intermediate sums
+    never leave cache, instead of streaming the whole segment through
+    memory once per operation.
+    """
+    scratch = np.empty(segment[:_MIX_BLOCK].shape, dtype=np.uint32)
+    for i in range(0, len(segment), _MIX_BLOCK):
+        seg = segment[i:i + _MIX_BLOCK]
+        blk = data[i:i + _MIX_BLOCK]
+        silent = _silent(seg, scratch[:len(seg)])
+        seg += blk
+        seg *= 0.5
+        np.copyto(seg, blk, where=silent)
@@ -1,28 +1,66 @@
-"""Metadata extraction — creation timestamps and file info via ffprobe."""
+"""Metadata extraction — creation timestamps and file info via ffprobe
+(with a direct MP4/MOV header read for the common camera case)."""
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
+import re
 import shutil
+import struct
 import subprocess
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 logger = logging.getLogger("audiosync.metadata")
 
+# ISO base media files whose movie header can be read without ffprobe
+_MP4_EXTENSIONS = {".mp4", ".mov", ".m4v", ".m4a"}
+# Seconds between the MP4 epoch (1904-01-01) and the Unix epoch
+_MP4_EPOCH_OFFSET = 2082844800
+# Largest creation time ffmpeg accepts (microseconds must fit an int64)
+_MAX_TIMESTAMP_S = (2**63 - 1) // 1_000_000
+
+# The usual camera form, e.g. 2024-01-15T20:32:09.000000Z or ...+01:00
+_ISO_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})"
+    r"(?:\.(\d{1,6}))?(Z|[+-]\d{2}:?\d{2})?"
+)
+
 
 def probe_creation_time(path: str) -> Optional[float]:
     """
     Extract creation_time as a Unix timestamp from an audio/video file.
 
     Fallback chain:
-      1. format_tags.creation_time (most reliable for MP4/MOV)
-      2. stream_tags.creation_time on the first audio stream
-      3. File modification time (os.path.getmtime)
+      1. MP4/MOV movie header (mvhd) creation time, read directly
+      2. format_tags.creation_time (most reliable for MP4/MOV)
+      3. stream_tags.creation_time on the first audio stream
+      4. File modification time (os.path.getmtime)
+
+    Results are cached per path and modification time.
     """
-    ffprobe = shutil.which("ffprobe")
+    mtime = _file_mtime(path)
+    if mtime is None:
+        return _probe_creation_time(path)
+    return _probe_creation_time_cached(path, mtime)
+
+
+@functools.lru_cache(maxsize=4096)
+def _probe_creation_time_cached(path: str, mtime: float) -> Optional[float]:
+    return _probe_creation_time(path)
+
+
+def _probe_creation_time(path: str) -> Optional[float]:
+    if os.path.splitext(path)[1].lower() in _MP4_EXTENSIONS:
+        ts = _probe_creation_time_mp4_fast(path)
+        if ts is not None:
+            return ts
+
+    ffprobe = _ffprobe_path()
     if ffprobe is None:
         return _file_mtime(path)
 
@@ -35,7 +73,7 @@ def probe_creation_time(path: str) -> Optional[float]:
             path,
         ]
         result = subprocess.run(
-            cmd, capture_output=True, timeout=10, text=True,
+            cmd, capture_output=True, timeout=10, stdin=subprocess.DEVNULL,
         )
         if result.returncode != 0:
             return _file_mtime(path)
@@ -61,6 +99,77 @@ def probe_creation_time(path: str) -> Optional[float]:
     return _file_mtime(path)
 
 
+def probe_creation_times(paths: list[str]) -> dict[str, Optional[float]]:
+    """
+    Probe creation times for many files at once, keyed by path.
+
+    Each probe waits on its own ffprobe process, so the probes run on a
+    thread pool rather than one after another.
+    """
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+    workers = min(16, (os.cpu_count() or 4) * 2, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(unique, pool.map(probe_creation_time, unique)))
+
+
+@functools.lru_cache(maxsize=1)
+def _ffprobe_path() -> Optional[str]:
+    """Locate ffprobe on PATH once per process."""
+    return shutil.which("ffprobe")
+
+
+def _probe_creation_time_mp4_fast(path: str) -> Optional[float]:
+    """Read the creation time from the moov/mvhd box, or None if absent."""
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            for kind, start, end in _mp4_boxes(f, 0, size):
+                if kind != b"moov":
+                    continue
+                for kind, start, end in _mp4_boxes(f, start, end):
+                    if kind != b"mvhd":
+                        continue
+                    f.seek(start)
+                    header = f.read(12)
+                    if header[0] == 1:
+                        created = struct.unpack(">Q", header[4:12])[0]
+                    else:
+                        created = struct.unpack(">I", header[4:8])[0]
+                    if not created:
+                        return None
+                    # Like ffmpeg's mov demuxer: values below the offset
+                    # come from muxers that wrote Unix time
+                    if created >= _MP4_EPOCH_OFFSET:
+                        created -= _MP4_EPOCH_OFFSET
+                    if created > _MAX_TIMESTAMP_S:
+                        return None
+                    return float(created)
+                return None
+    except (OSError, struct.error, IndexError) as exc:
+        logger.debug("MP4 header parse failed for %s: %s", path, exc)
+    return None
+
+
+def _mp4_boxes(f, start: int, end: int):
+    """Yield ``(type, payload_start, box_end)`` for the boxes in a byte range."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[float]:
     """Parse an ISO 8601 timestamp string to Unix epoch seconds."""
     if not value:
@@ -71,6 +180,13 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[float]:
         #   2024-01-15T20:32:09Z
         #   2024-01-15 20:32:09
         value = value.strip()
+        match = _ISO_RE.fullmatch(value)
+        if match:
+            ts = _iso_match_timestamp(match)
+            if ts is not None:
+                return ts
+
+        # Anything else goes through the full list of accepted layouts
         for fmt in (
             "%Y-%m-%dT%H:%M:%S.%fZ",
             "%Y-%m-%dT%H:%M:%SZ",
@@ -92,6 +208,24 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[float]:
     return None
 
 
+def _iso_match_timestamp(match: re.Match) -> Optional[float]:
+    """Build the timestamp for an ``_ISO_RE`` match; naive times are UTC."""
+    year, month, day, hour, minute, second, frac, tz = match.groups()
+    if tz is None or tz == "Z":
+        tzinfo = timezone.utc
+    else:
+        offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[-2:]))
+        tzinfo = timezone(-offset if tz[0] == "-" else offset)
+    try:
+        dt = datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(frac.ljust(6, "0")) if frac else 0, tzinfo=tzinfo,
+        )
+    except ValueError:
+        return None
+    return dt.timestamp()
+
+
 def _file_mtime(path: str) -> Optional[float]:
     """Fallback: return the file's modification time."""
     try:
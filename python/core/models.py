@@ -24,7 +24,7 @@ class Clip:
 
     file_path: str
     name: str
-    samples: np.ndarray                         # 8 kHz mono for analysis
+    samples: Optional[np.ndarray]               # 8 kHz mono for analysis (None once released)
     sample_rate: int                            # Always ANALYSIS_SR during analysis
     original_sr: int                            # Original file sample rate
     original_channels: int                      # Original channel count
@@ -45,12 +45,19 @@ class Clip:
 
     @property
     def length_samples(self) -> int:
+        if self.samples is None:
+            # duration_s was derived from the released samples
+            return int(round(self.duration_s * self.sample_rate))
         return len(self.samples)
 
     @property
     def end_samples(self) -> int:
         return self.timeline_offset_samples + self.length_samples
 
+    def release_samples(self) -> None:
+        """Drop the analysis samples; export re-reads the original file."""
+        self.samples = None
+
     def timeline_offset_at_sr(self, target_sr: int) -> int:
         """Convert timeline offset from analysis SR to a target SR."""
         if self.sample_rate == target_sr:
@@ -131,6 +138,12 @@ class SyncConfig:
     drift_correction: bool = True               # Apply drift correction on export
     drift_threshold_ppm: float = 0.3            # Minimum drift to correct
 
+    # Memory
+    release_samples: bool = False               # Free analysis samples once analyze() is done
+
+    # Acceleration
+    use_gpu: bool = False                       # Correlate long references with CuPy if available
+
     @property
     def is_lossy(self) -> bool:
         """True for lossy formats like MP3."""
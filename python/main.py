@@ -28,10 +28,11 @@ _EXTRA_PATHS = [
     "/sbin",
 ]
 _current_path = os.environ.get("PATH", "")
-for p in _EXTRA_PATHS:
-    if p not in _current_path and os.path.isdir(p):
-        _current_path = p + os.pathsep + _current_path
-os.environ["PATH"] = _current_path
+_existing = set(_current_path.split(os.pathsep))
+# Prepended in reverse list order: the last entry ends up first
+_missing = [p for p in reversed(_EXTRA_PATHS) if p not in _existing and os.path.isdir(p)]
+if _missing:
+    os.environ["PATH"] = os.pathsep.join(_missing + [_current_path])
 
 
 def _crash_log_path() -> str:
@@ -94,45 +95,10 @@ def main() -> None:
         app.setOrganizationName("AudioSync")
         app.setApplicationVersion(__version__)
 
-        from PyQt6.QtGui import QPalette, QColor
-
         from app.main_window import MainWindow
-        from app.theme import STYLESHEET, COLORS
-
-        # Force dark palette globally — ensures ALL widgets have light text
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(COLORS["bg_deep"]))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(COLORS["text"]))
-        palette.setColor(QPalette.ColorRole.Base, QColor(COLORS["bg_dark"]))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(COLORS["bg_card"]))
-        palette.setColor(QPalette.ColorRole.Text, QColor(COLORS["text"]))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(COLORS["text_bright"]))
-        palette.setColor(QPalette.ColorRole.Button, QColor(COLORS["bg_dark"]))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(COLORS["text"]))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(COLORS["accent"]))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(COLORS["bg_card"]))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(COLORS["text"]))
-        palette.setColor(QPalette.ColorRole.PlaceholderText, QColor(COLORS["text_muted"]))
-        palette.setColor(QPalette.ColorRole.Link, QColor(COLORS["accent"]))
-        palette.setColor(QPalette.ColorRole.LinkVisited, QColor(COLORS["secondary"]))
-
-        # Disabled state
-        palette.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.WindowText, QColor(COLORS["text_muted"])
-        )
-        palette.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.Text, QColor(COLORS["text_muted"])
-        )
-        palette.setColor(
-            QPalette.ColorGroup.Disabled,
-            QPalette.ColorRole.ButtonText, QColor(COLORS["text_muted"])
-        )
+        from app.theme import prepare_theme
 
-        app.setPalette(palette)
-        app.setStyleSheet(STYLESHEET)
+        prepare_theme(app)
 
         logger.info("Starting AudioSync Pro %s", __version__)
         window = MainWindow()
@@ -0,0 +1,73 @@
+"""Tests for the CLI's JSON output."""
+
+import json
+
+import numpy as np
+import pytest
+
+import cli
+from core.models import Clip, SyncResult, Track
+
+
+def _analysed_tracks() -> list[Track]:
+    clip = Clip(
+        file_path="/media/CamA_001.wav",
+        name="CamA_001.wav",
+        samples=None,
+        sample_rate=8000,
+        original_sr=48000,
+        original_channels=2,
+        duration_s=12.5,
+        timeline_offset_s=1.25,
+        confidence=42.0,
+        analyzed=True,
+        # measure_drift hands back NumPy scalars
+        drift_ppm=np.float64(12.3456),
+        drift_confidence=np.float64(0.98765),
+        drift_corrected=True,
+    )
+    return [Track(name="CamA", clips=[clip])]
+
+
+def _result() -> SyncResult:
+    return SyncResult(
+        reference_track_index=0,
+        total_timeline_samples=100000,
+        total_timeline_s=12.5,
+        sample_rate=8000,
+        avg_confidence=42.0,
+        drift_detected=True,
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_with_drift(monkeypatch, capsys, use_orjson):
+    if use_orjson and cli.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(cli, "orjson", None)
+
+    cli._write_json(cli._format_result(_analysed_tracks(), _result()))
+
+    out = capsys.readouterr().out
+    assert out.endswith("\n")
+    clip = json.loads(out)["tracks"][0]["clips"][0]
+    assert clip["drift_ppm"] == 12.346
+    assert clip["drift_confidence"] == 0.988
+
+
+def test_write_json_paths_agree(monkeypatch, capsysbinary):
+    if cli.orjson is None:
+        pytest.skip("orjson not installed")
+    tracks = _analysed_tracks()
+    tracks[0].name = "Kamera Café 📷"
+    output = cli._format_result(tracks, _result())
+
+    cli._write_json(output)
+    fast = capsysbinary.readouterr().out
+    monkeypatch.setattr(cli, "orjson", None)
+    cli._write_json(output)
+    fallback = capsysbinary.readouterr().out
+
+    assert fast == fallback
+    assert "Kamera Café 📷".encode("utf-8") in fallback
@@ -0,0 +1,94 @@
+"""Tests for deferred clip-row building in the track panel."""
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QUrl
+
+from core.audio_io import is_supported_file
+from core.models import Clip, Track
+from app.track_card import TrackPanel, _EAGER_CLIP_ROWS, _collect_paths
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+def _clip(i: int) -> Clip:
+    return Clip(
+        file_path=f"/media/clip{i}.wav",
+        name=f"clip{i}.wav",
+        samples=None,
+        sample_rate=8000,
+        original_sr=48000,
+        original_channels=2,
+        duration_s=60.0 + i,
+        creation_time=1.7e9 + 100 * i,
+    )
+
+
+def _settle(app) -> None:
+    for _ in range(5):
+        app.processEvents()
+
+
+def _panel(app, height: int) -> TrackPanel:
+    panel = TrackPanel()
+    panel.resize(600, height)
+    panel.show()
+    _settle(app)
+    return panel
+
+
+def test_rows_built_when_content_fits_without_scrollbar(qapp):
+    panel = _panel(qapp, 900)
+    n = _EAGER_CLIP_ROWS + 1
+    panel.tracks = [Track(name="A", clips=[_clip(i) for i in range(n)])]
+    _settle(qapp)
+
+    assert panel._scroll.verticalScrollBar().maximum() == 0
+    card = panel._cards[0]
+    assert not card.has_deferred_rows()
+    assert len(card._clip_rows) == n
+
+
+def test_rows_built_when_resize_reveals_card(qapp):
+    panel = _panel(qapp, 400)
+    n = 3 * _EAGER_CLIP_ROWS
+    panel.tracks = [
+        Track(name=f"T{t}", clips=[_clip(i) for i in range(n)]) for t in range(6)
+    ]
+    _settle(qapp)
+    assert panel._cards[-1].has_deferred_rows()
+
+    panel.resize(600, 8000)
+    _settle(qapp)
+    assert not any(card.has_deferred_rows() for card in panel._cards)
+
+
+def test_offscreen_cards_stay_deferred(qapp):
+    panel = _panel(qapp, 400)
+    n = 3 * _EAGER_CLIP_ROWS
+    panel.tracks = [
+        Track(name=f"T{t}", clips=[_clip(i) for i in range(n)]) for t in range(10)
+    ]
+    _settle(qapp)
+
+    assert not panel._cards[0].has_deferred_rows()
+    assert panel._cards[-1].has_deferred_rows()
+
+
+@pytest.mark.parametrize("path", [
+    "/media/take1.WAV",
+    "/media/take1.mp4",
+    "/media/.wav",
+    "/media/wav",
+    "/media/project.wav/notes",
+    "/media/take1.txt",
+])
+def test_drop_filter_matches_loader(path):
+    accepted = _collect_paths([QUrl.fromLocalFile(path)]) == [path]
+    assert accepted == is_supported_file(path)